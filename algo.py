@@ -1,6 +1,7 @@
 import os
 import sys
-import ccxt
+import ccxt.async_support as ccxt_async
+import ccxt.pro as ccxt_pro
 import logging
 import re
 import asyncio
@@ -9,10 +10,25 @@ from datetime import datetime
 from dotenv import load_dotenv
 from telethon import TelegramClient
 from notifier.notifier import send_telegram_message
-from scrapers.binance import BinanceScraper, extract_symbols
-from scrapers.kraken import KrakenScraper, extract_symbols_kraken
+from scrapers.binance import BinanceScraper
+from scrapers.kraken import KrakenScraper
+from scrapers.coordinator import PollingCoordinator
+from scrapers.scheduler import AdaptiveScheduler, load_announcement_times
 from twitter.coinbase import monitor_tweets, check_tweet, extract_ticker, get_time_difference
 from telegram.monitor import monitor_telegram
+from execution.engine import ExecutionEngine
+from execution.router import ExecutionRouter, Venue
+from execution.watcher import ListingWatcher
+from execution.exits import ExitEngine
+from execution.claims import SymbolClaims
+from execution.paper import PaperExchange
+from state.store import StateStore
+from state.dedup import DedupStore
+from state.journal import AnnouncementJournal, load_journal_times
+from metrics.latency import ClockOffset, LatencyBudget
+from pipeline.bus import Pipeline, AnnouncementEvent
+from symbols.extract import SymbolEngine
+from symbols.tickers import TickerIndex
 import tweepy
 import sqlite3
 
@@ -45,42 +61,199 @@ GATE_IO_SECRET_KEY = os.getenv("GATE_IO_SECRET_KEY")
 # Setup Twitter API credentials (only bearer token now)
 TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN")
 
-# Setup Gate.io client
-gateio = ccxt.gateio({
+# Binance scraper backend: "http" (CMS endpoint, Selenium fallback) or "selenium"
+BINANCE_SCRAPER_MODE = os.getenv("BINANCE_SCRAPER_MODE", "http")
+# Selenium extraction: "script" (in-page, default), "fast" or "soup" (parse page_source)
+SCRAPER_EXTRACTOR = os.getenv("SCRAPER_EXTRACTOR", "script")
+
+# Scraper polling: per-worker interval, workers per source and their phase offsets
+# ("even", "random" or "none"). N workers together sample every interval / N seconds.
+SCRAPER_POLL_INTERVAL = float(os.getenv("SCRAPER_POLL_INTERVAL", "10"))
+BINANCE_WORKERS = int(os.getenv("BINANCE_WORKERS", "1"))
+KRAKEN_WORKERS = int(os.getenv("KRAKEN_WORKERS", "1"))
+POLL_OFFSET_POLICY = os.getenv("POLL_OFFSET_POLICY", "even")
+
+# Adaptive polling: intervals used during historically hot / quiet hours of the day.
+SCRAPER_HOT_INTERVAL = float(os.getenv("SCRAPER_HOT_INTERVAL", str(SCRAPER_POLL_INTERVAL / 2)))
+SCRAPER_COLD_INTERVAL = float(os.getenv("SCRAPER_COLD_INTERVAL", str(SCRAPER_POLL_INTERVAL * 3)))
+COINBASE_POLL_INTERVAL = float(os.getenv("COINBASE_POLL_INTERVAL", "900"))
+BOT_LOG_PATH = "logs/crypto_bot.log"
+ANNOUNCEMENT_JOURNAL_PATH = os.getenv("ANNOUNCEMENT_JOURNAL_PATH", "logs/announcements.jsonl")
+
+def make_scheduler(name, base_interval, hot_interval, cold_interval, message_pattern, sources=()):
+    """
+    Builds an AdaptiveScheduler that learns announcement hours from the
+    announcement journal entries of `sources`, or from the bot log while the
+    journal has none.
+    """
+    return AdaptiveScheduler(
+        name, base_interval, hot_interval=hot_interval, cold_interval=cold_interval,
+        history=lambda: (load_journal_times(ANNOUNCEMENT_JOURNAL_PATH, sources)
+                         or load_announcement_times(BOT_LOG_PATH, message_pattern))
+    )
+
+# PAPER_TRADING=1 replaces every exchange with a local simulation (see execution/paper.py).
+PAPER_TRADING = os.getenv("PAPER_TRADING", "0") == "1"
+
+def paper_exchange(exchange_id):
+    return PaperExchange(
+        exchange_id,
+        bases=[b.strip() for b in os.getenv("PAPER_MARKETS", "BTC,ETH,SOL").split(",") if b.strip()],
+        balance=float(os.getenv("PAPER_BALANCE", "10000")),
+        latency=float(os.getenv("PAPER_LATENCY_MS", "50")) / 1000,
+        error_rate=float(os.getenv("PAPER_ERROR_RATE", "0")),
+        slippage=float(os.getenv("PAPER_SLIPPAGE", "0.002")),
+    )
+
+# Setup Gate.io client (async; markets are loaded by the engine at start-up)
+gateio = paper_exchange("gateio") if PAPER_TRADING else ccxt_async.gate({
     'apiKey': GATE_IO_API_KEY,
     'secret': GATE_IO_SECRET_KEY,
     'enableRateLimit': True,
 })
+USDT_PER_TRADE = 300
+
+# Additional ccxt venues, e.g. EXTRA_VENUES=mexc,bitget with MEXC_API_KEY / MEXC_SECRET_KEY.
+# ROUTING_MODE: "preferred" (Gate.io first), "fastest" (lowest order-ack latency) or "split".
+EXTRA_VENUES = [v.strip() for v in os.getenv("EXTRA_VENUES", "").split(",") if v.strip()]
+ROUTING_MODE = os.getenv("ROUTING_MODE", "preferred")
+
+# Announcement-to-order latency per source, with publish times compared on Gate.io's clock.
+LATENCY_REPORT_INTERVAL = float(os.getenv("LATENCY_REPORT_INTERVAL", "3600"))
+latency_budget = LatencyBudget(ClockOffset(gateio))
+
+def build_router():
+    venues = [Venue("gateio", ExecutionEngine(gateio, latency=latency_budget), preference=len(EXTRA_VENUES) + 1)]
+    for rank, exchange_id in enumerate(EXTRA_VENUES):
+        exchange = paper_exchange(exchange_id) if PAPER_TRADING else getattr(ccxt_async, exchange_id)({
+            'apiKey': os.getenv(f"{exchange_id.upper()}_API_KEY"),
+            'secret': os.getenv(f"{exchange_id.upper()}_SECRET_KEY"),
+        })
+        venues.append(Venue(exchange_id, ExecutionEngine(exchange, latency=latency_budget), preference=len(EXTRA_VENUES) - rank))
+    return ExecutionRouter(venues, mode=ROUTING_MODE)
+
+router = build_router()
+gateio_engine = router.venues[0].engine
+latency_budget.clock.limiter = gateio_engine.limiter
+
+# Automated exits for Gate.io positions (opt-in with EXIT_ENGINE=1), evaluated on every
+# websocket ticker update. Fractions of the entry price; 0 disables a rule.
+EXIT_ENGINE = os.getenv("EXIT_ENGINE", "0") == "1"
+EXIT_TAKE_PROFIT = float(os.getenv("EXIT_TAKE_PROFIT", "1.0"))
+EXIT_STOP_LOSS = float(os.getenv("EXIT_STOP_LOSS", "0.25"))
+EXIT_TRAILING_STOP = float(os.getenv("EXIT_TRAILING_STOP", "0.2"))
+
+background_tasks = set()
+
+def spawn(coroutine):
+    task = asyncio.create_task(coroutine)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+async def notify_exit(position, reason, result):
+    if isinstance(result, Exception):
+        message = f"{reason} exit for {position.symbol} failed: {result}. Please sell manually."
+    else:
+        message = f"Sold {position.amount} {position.symbol} on {reason} (entry {position.entry_price}, peak {position.peak_price})"
+    notify(message)
+
+exit_engine = ExitEngine(
+    gateio if PAPER_TRADING else ccxt_pro.gate(), gateio_engine, take_profit=EXIT_TAKE_PROFIT, stop_loss=EXIT_STOP_LOSS,
+    trailing_stop=EXIT_TRAILING_STOP, on_exit=notify_exit
+) if EXIT_ENGINE else None
+
+def manage_exits(venue_name, symbol, order):
+    if exit_engine is not None and venue_name == "gateio":
+        spawn(exit_engine.open(symbol, order))
+
+# Symbols announced before their Gate.io pair opens are bought as soon as it trades.
+LISTING_WATCH_INTERVAL = float(os.getenv("LISTING_WATCH_INTERVAL", "0.5"))
+LISTING_WATCH_TTL = float(os.getenv("LISTING_WATCH_TTL", str(6 * 3600)))
+
+# Single-flight per symbol: the first source to claim a symbol places the order and
+# sources that detect it later attach to that result instead of buying again.
+claims = SymbolClaims()
+
+async def buy_opened_listing(symbol, detected_at):
+    if symbol in processed_listings:
+        return
+    claim, won = claims.claim(symbol, "listing-watcher", detected_at)
+    if not won:
+        return
+    # The watcher has checked the pair's status; the index may not list a new pair yet,
+    # so order on Gate.io directly. The wait for the pair to open is not execution lag:
+    # time the order from the open, under the watcher's own label.
+    opened_at = time.time()
+    latency_budget.detected("listing-watcher", opened_at)
+    try:
+        order = await gateio_engine.market_buy(symbol, USDT_PER_TRADE, detected_at=opened_at)
+        logging.info(f"Trade executed on pair open: {order}")
+        processed_listings.add(symbol)
+        claims.resolve(claim, [("gateio", order)])
+        manage_exits("gateio", symbol, order)
+        notify(f"\u2705 Bought {symbol} as soon as {symbol}/USDT opened on Gate.io")
+    except Exception as e:
+        claims.release(claim, e)
+        logging.error(f"Error executing trade for {symbol} on pair open: {e}")
+        notify(f"{symbol} opened on Gate.io but the order failed ({e}). Please buy manually.")
+    spawn(gateio_engine.markets.refresh())
 
-# Setup Telegram client
-telegram_client = TelegramClient("crypto_bot", TELEGRAM_API_ID, TELEGRAM_API_HASH)
+async def listing_watch_expired(symbol):
+    notify(f"{symbol} did not open on Gate.io within {LISTING_WATCH_TTL / 3600:.0f}h. Please buy manually.")
+
+listing_watcher = ListingWatcher(
+    gateio, buy_opened_listing, on_expire=listing_watch_expired,
+    poll_interval=LISTING_WATCH_INTERVAL, ttl=LISTING_WATCH_TTL, limiter=gateio_engine.limiter,
+    markets=gateio_engine.markets
+)
 
 # Setup Tweepy client for Coinbase tracking
 twitter_client_api = tweepy.Client(
     bearer_token=TWITTER_BEARER_TOKEN
 )
 
-# Global pointers and processed sets
-processed_listings = set()  # For executed trades
-processed_announcements_text = set()  # For Binance announcements (normalized)
-last_binance_announcement_url = None
-processed_kraken_announcements_text = set()  # For Kraken announcements (normalized)
-last_kraken_announcement_url = None
+# Global pointers and processed sets, restored from and persisted to the state store
+BOT_STATE_PATH = os.getenv("BOT_STATE_PATH", "bot_state.db")
+state = StateStore(BOT_STATE_PATH)
+# Announcement dedup keeps 8-byte hashes, forgets titles not seen for DEDUP_TTL_DAYS and
+# holds at most DEDUP_MAX_ENTRIES per source (DEDUP_BLOOM_BITS=0 disables the Bloom filter).
+# The TTL must outlast the oldest title still on a source's visible list, or that title is
+# published again whenever the stored pointer drops off the page.
+DEDUP_TTL = float(os.getenv("DEDUP_TTL_DAYS", "365")) * 86400
+DEDUP_MAX_ENTRIES = int(os.getenv("DEDUP_MAX_ENTRIES", "50000"))
+DEDUP_BLOOM_BITS = int(os.getenv("DEDUP_BLOOM_BITS", str(1 << 20)))
+
+def dedup_store(name):
+    return DedupStore(name, ttl=DEDUP_TTL, max_entries=DEDUP_MAX_ENTRIES, bloom_bits=DEDUP_BLOOM_BITS, store=state)
+
+processed_listings = state.load_set("listings")  # For executed trades
+processed_announcements_text = dedup_store("binance_announcements")  # For Binance announcements (normalized)
+last_binance_announcement_url = state.get_pointer("last_binance_announcement_url")
+processed_kraken_announcements_text = dedup_store("kraken_announcements")  # For Kraken announcements (normalized)
+last_kraken_announcement_url = state.get_pointer("last_kraken_announcement_url")
 
 # Asynchronous function to periodically fetch Binance announcements.
 async def periodic_fetch_binance_announcements():
-    scraper = BinanceScraper("https://www.binance.com/en/support/announcement/new-cryptocurrency-listing?c=48")
-    global last_binance_announcement_url, processed_announcements_text
+    coordinator = PollingCoordinator(
+        "Binance",
+        lambda: BinanceScraper("https://www.binance.com/en/support/announcement/new-cryptocurrency-listing?c=48", mode=BINANCE_SCRAPER_MODE, extractor=SCRAPER_EXTRACTOR),
+        workers=BINANCE_WORKERS, interval=SCRAPER_POLL_INTERVAL, offset_policy=POLL_OFFSET_POLICY,
+        scheduler=make_scheduler("Binance", SCRAPER_POLL_INTERVAL, SCRAPER_HOT_INTERVAL, SCRAPER_COLD_INTERVAL,
+                                 r"^New Binance announcement detected|^Detected listing announcement in Telegram",
+                                 sources=("binance", "telegram"))
+    )
+    global last_binance_announcement_url
+    await coordinator.start()
     try:
         while True:
-            logging.info("Refreshing Binance announcements...")
-            announcements = scraper.fetch_announcements()
+            announcements = await coordinator.next_result()
             if not announcements:
                 logging.warning("No Binance announcements fetched.")
             else:
                 current_top_url = announcements[0][1]
                 if last_binance_announcement_url is None:
                     last_binance_announcement_url = current_top_url
+                    state.set_pointer("last_binance_announcement_url", current_top_url)
                     for title, href, norm in announcements:
                         processed_announcements_text.add(norm)
                     logging.info(f"Initial Binance announcements loaded; pointer set to: {last_binance_announcement_url}")
@@ -92,37 +265,34 @@ async def periodic_fetch_binance_announcements():
                         new_to_process.append((title, href, norm))
                     if new_to_process:
                         for title, href, norm in reversed(new_to_process):
-                            if norm in processed_announcements_text:
-                                continue
-                            processed_announcements_text.add(norm)
-                            logging.info(f"New Binance announcement detected: {title} - {href}")
-                            send_telegram_message(f"\U0001F680 Binance New Listing: {title}\n\U0001F517 {href}")
-                            symbols = extract_symbols(title)
-                            if symbols:
-                                for symbol in symbols:
-                                    logging.info(f"Extracted symbol from Binance: {symbol}")
-                                    execute_trade(symbol)
-                            else:
-                                logging.info("No symbol extracted from Binance announcement.")
+                            await pipeline.publish(AnnouncementEvent("binance", title, href=href, norm=norm,
+                                                                     published_at=BinanceScraper.release_times.get(href)))
                     last_binance_announcement_url = current_top_url
-            await asyncio.sleep(10)
+                    state.set_pointer("last_binance_announcement_url", current_top_url)
     finally:
-        scraper.quit()
+        await coordinator.stop()
 
 # Asynchronous function to periodically fetch Kraken announcements.
 async def periodic_fetch_kraken_announcements():
-    scraper = KrakenScraper("https://blog.kraken.com/category/product/asset-listings")
-    global last_kraken_announcement_url, processed_kraken_announcements_text
+    coordinator = PollingCoordinator(
+        "Kraken",
+        lambda: KrakenScraper("https://blog.kraken.com/category/product/asset-listings", extractor=SCRAPER_EXTRACTOR),
+        workers=KRAKEN_WORKERS, interval=SCRAPER_POLL_INTERVAL, offset_policy=POLL_OFFSET_POLICY,
+        scheduler=make_scheduler("Kraken", SCRAPER_POLL_INTERVAL, SCRAPER_HOT_INTERVAL, SCRAPER_COLD_INTERVAL,
+                                 r"^New Kraken announcement detected", sources=("kraken",))
+    )
+    global last_kraken_announcement_url
+    await coordinator.start()
     try:
         while True:
-            logging.info("Refreshing Kraken announcements...")
-            announcements = scraper.fetch_announcements()
+            announcements = await coordinator.next_result()
             if not announcements:
                 logging.warning("No Kraken announcements fetched.")
             else:
                 current_top_url = announcements[0][1]
                 if last_kraken_announcement_url is None:
                     last_kraken_announcement_url = current_top_url
+                    state.set_pointer("last_kraken_announcement_url", current_top_url)
                     for title, href, norm in announcements:
                         processed_kraken_announcements_text.add(norm)
                     logging.info(f"Initial Kraken announcements loaded; pointer set to: {last_kraken_announcement_url}")
@@ -134,72 +304,200 @@ async def periodic_fetch_kraken_announcements():
                         new_to_process.append((title, href, norm))
                     if new_to_process:
                         for title, href, norm in reversed(new_to_process):
-                            if norm in processed_kraken_announcements_text:
-                                continue
-                            processed_kraken_announcements_text.add(norm)
-                            logging.info(f"New Kraken announcement detected: {title} - {href}")
-                            send_telegram_message(f"\U0001F680 Kraken New Listing: {title}\n\U0001F517 {href}")
-                            symbols = extract_symbols_kraken(title)
-                            if symbols:
-                                for symbol in symbols:
-                                    logging.info(f"Extracted symbol from Kraken: {symbol}")
-                                    execute_trade(symbol)
-                            else:
-                                logging.info("No symbol extracted from Kraken announcement.")
+                            await pipeline.publish(AnnouncementEvent("kraken", title, href=href, norm=norm))
                     last_kraken_announcement_url = current_top_url
-            await asyncio.sleep(10)
+                    state.set_pointer("last_kraken_announcement_url", current_top_url)
     finally:
-        scraper.quit()
+        await coordinator.stop()
 
 # Asynchronous function to periodically fetch Coinbase tweets for listings.
 async def periodic_fetch_coinbase_tweets():
     from twitter.coinbase import monitor_tweets
+    scheduler = make_scheduler("Coinbase", COINBASE_POLL_INTERVAL, COINBASE_POLL_INTERVAL / 3, COINBASE_POLL_INTERVAL * 2,
+                               r"^(Roadmap addition|Support tweet|Support without prior roadmap) detected")
     while True:
         logging.info("Fetching Coinbase tweets...")
         try:
             await asyncio.to_thread(monitor_tweets, twitter_client_api)
+            scheduler.record_success()
         except Exception as e:
             logging.error(f"Error in Coinbase tweet tracking: {e}")
-        await asyncio.sleep(900)
+            scheduler.record_error()
+        await scheduler.maybe_relearn()
+        await asyncio.sleep(scheduler.next_delay())
 
-# Trade execution function.
-def execute_trade(symbol):
-    if symbol in processed_listings:
-        logging.info(f"Trade for {symbol} already executed, skipping...")
-        return
+# Trade execution: all symbols from one announcement are routed concurrently.
+async def execute_trades(symbols, detected_at=None, source=None, published_at=None):
+    if detected_at is not None and source is not None:
+        latency_budget.detected(source, detected_at, published_at)
+    outcomes, to_buy, followers = {}, [], []
+    for symbol in dict.fromkeys(symbol.strip().upper() for symbol in symbols):
+        if symbol in processed_listings:
+            logging.info(f"Trade for {symbol} already executed, skipping...")
+            outcomes[symbol] = "already-executed"
+            continue
+        claim, won = claims.claim(symbol, source, detected_at)
+        if not won:
+            followers.append(claim)
+            continue
+        if not router.candidates(symbol, USDT_PER_TRADE):
+            reason = "; ".join(venue.engine.markets.check(symbol, USDT_PER_TRADE)[1] for venue in router.venues)
+            markets = [venue.engine.markets.lookup(symbol) for venue in router.venues]
+            if any(market is not None and market.active for market in markets):
+                # Trading, but not for this order (e.g. below the minimum cost): waiting will not help.
+                logging.warning(f"Not ordering {symbol}: {reason}")
+                claims.release(claim)
+                notify(f"Not buying {symbol}: {reason}. Please buy manually.")
+                outcomes[symbol] = "rejected"
+                continue
+            logging.warning(f"Deferring order for {symbol}: {reason}")
+            claims.release(claim)
+            listing_watcher.add(symbol, detected_at=detected_at)
+            notify(f"{symbol} is not trading on Gate.io yet ({reason}). Watching for the pair to open.")
+            outcomes[symbol] = "deferred"
+            continue
+        to_buy.append((symbol, claim))
+    if to_buy:
+        results = await router.buy_many([symbol for symbol, _ in to_buy], USDT_PER_TRADE, detected_at=detected_at)
+        for (symbol, claim), result in zip(to_buy, results):
+            if isinstance(result, Exception):
+                claims.release(claim, result)
+                logging.error(f"Error executing trade for {symbol}: {result}")
+                tried = ", ".join(venue.name for venue in router.candidates(symbol, None)) or "any venue"
+                notify_message = f"{symbol} could not be bought on {tried} ({result}). Please buy manually."
+                logging.warning(notify_message)
+                notify(notify_message)
+                outcomes[symbol] = "failed"
+            else:
+                fills = [(venue_name, order) for venue_name, order in result if not isinstance(order, Exception)]
+                unfilled = [(venue_name, error) for venue_name, error in result if isinstance(error, Exception)]
+                for venue_name, order in fills:
+                    logging.info(f"Trade executed on {venue_name}: {order}")
+                    manage_exits(venue_name, symbol, order)
+                processed_listings.add(symbol)
+                claims.resolve(claim, fills)
+                outcomes[symbol] = "filled"
+                if unfilled:
+                    missing = USDT_PER_TRADE * len(unfilled) / len(result)
+                    failures = ", ".join(f"{venue_name}: {error}" for venue_name, error in unfilled)
+                    notify_message = (f"{symbol} only partly filled: {missing:.2f} USDT of {USDT_PER_TRADE} was not bought "
+                                      f"({failures}). Please buy the rest manually.")
+                    logging.warning(notify_message)
+                    notify(notify_message)
+                    outcomes[symbol] = "partially filled"
+    for claim in followers:
+        result = await claim.wait()
+        outcome = "filled" if result and not isinstance(result, Exception) else "did not fill"
+        logging.info(f"{claim.symbol} from {source} attached to the {claim.source} order, which {outcome}")
+        outcomes[claim.symbol] = f"attached to {claim.source}"
+    return outcomes
+
+async def execute_trade(symbol, detected_at=None, source=None, published_at=None):
+    return await execute_trades([symbol], detected_at=detected_at, source=source, published_at=published_at)
+
+# Announcement pipeline: sources publish raw events; parsing, dedup, execution and
+# notification run as separate stages with bounded queues, so a slow notifier never
+# delays an order.
+# Every announcement event and the decision taken on it, for analysis and `python -m state.journal`.
+journal = AnnouncementJournal(ANNOUNCEMENT_JOURNAL_PATH)
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "100"))
+PIPELINE_REPORT_INTERVAL = float(os.getenv("PIPELINE_REPORT_INTERVAL", "600"))
+EXECUTION_WORKERS = int(os.getenv("EXECUTION_WORKERS", "4"))
+symbol_engine = SymbolEngine()
+# Extracted symbols are checked against the venues' listed tickers before execution.
+ticker_index = TickerIndex()
+TICKER_INDEX_REFRESH = float(os.getenv("TICKER_INDEX_REFRESH", "300"))
+# Telegram relays both exchanges' announcements, so it dedups against (and marks) both sets.
+SEEN_ANNOUNCEMENTS = {
+    "binance": (processed_announcements_text,),
+    "kraken": (processed_kraken_announcements_text,),
+    "telegram": (processed_announcements_text, processed_kraken_announcements_text),
+}
+
+async def parse_announcement(event):
+    # Scraped titles are already filtered by the scrapers; Telegram carries every channel message.
+    if event.source == "telegram" and not symbol_engine.trigger(event.text):
+        journal.record(event, "not-a-listing")
+        return None
+    event.symbols, event.unresolved = ticker_index.validate(symbol_engine.extract(event.source, event.text))
+    return event
+
+async def dedup_announcement(event):
+    seen = SEEN_ANNOUNCEMENTS[event.source]
+    name = event.source.capitalize()
+    if any(event.norm in processed for processed in seen):
+        logging.info(f"{name} announcement already processed; skipping.")
+        journal.record(event, "duplicate")
+        return None
+    for processed in seen:
+        processed.add(event.norm)
+    if event.source == "telegram":
+        logging.info("Detected listing announcement in Telegram")
+    else:
+        logging.info(f"New {name} announcement detected: {event.text} - {event.href}")
+        notify(f"\U0001F680 {name} New Listing: {event.text}\n\U0001F517 {event.href}")
+    for unresolved in event.unresolved:
+        suggestion = ticker_index.suggest(unresolved)
+        hint = f" (closest listed asset: {suggestion})" if suggestion else ""
+        notify(f"Could not resolve {unresolved!r} from the {name} announcement to a ticker{hint}. Not trading it; please check manually.")
+    if not event.symbols:
+        logging.info(f"No symbol extracted from {name} announcement.")
+        journal.record(event, "no-symbols")
+        return None
+    for symbol in event.symbols:
+        logging.info(f"Extracted symbol from {name}: {symbol}")
+    return event
+
+async def execute_announcement(event):
     try:
-        market = f"{symbol}/USDT"
-        gateio.options['createMarketBuyOrderRequiresPrice'] = False
-        usdt_to_spend = 300
-        logging.info(f"Placing market order for {market} on Gate.io with {usdt_to_spend} USDT")
-        order = gateio.create_order(
-            symbol=market,
-            type="market",
-            side="buy",
-            amount=None,
-            params={"cost": usdt_to_spend}
-        )
-        logging.info(f"Trade executed: {order}")
-        processed_listings.add(symbol)
+        outcomes = await execute_trades(event.symbols, detected_at=event.detected_at, source=event.source,
+                                        published_at=event.published_at)
     except Exception as e:
-        logging.error(f"Error executing trade for {symbol}: {e}")
-        notify_message = f"{symbol} might not be available on Gate.io. Please buy manually."
-        logging.warning(notify_message)
-        send_telegram_message(notify_message)
+        journal.record(event, f"error: {e}")
+        raise
+    journal.record(event, outcomes)
+
+async def send_notification(message):
+    await asyncio.to_thread(send_telegram_message, message)
+
+def notify(message):
+    pipeline.stages["notify"].offer(message)
+
+pipeline = Pipeline("Announcement")
+pipeline.stage("parse", parse_announcement, maxsize=PIPELINE_QUEUE_SIZE)
+pipeline.stage("dedup", dedup_announcement, after="parse", maxsize=PIPELINE_QUEUE_SIZE)
+pipeline.stage("execute", execute_announcement, after="dedup", workers=EXECUTION_WORKERS, maxsize=PIPELINE_QUEUE_SIZE)
+pipeline.stage("notify", send_notification, maxsize=PIPELINE_QUEUE_SIZE, drop_when_full=True)
+pipeline.reporters += [processed_announcements_text.log_stats, processed_kraken_announcements_text.log_stats, claims.log_report]
 
 # Asynchronous function to monitor Telegram channels for announcements.
+# The client is built here rather than at import so tools that import this module
+# (e.g. the journal replay) run without Telegram credentials.
 async def monitor_telegram():
     from telegram.monitor import monitor_telegram as tg_monitor
-    await tg_monitor(telegram_client, processed_announcements_text, processed_kraken_announcements_text, execute_trade, extract_symbols, extract_symbols_kraken)
+    telegram_client = TelegramClient("crypto_bot", TELEGRAM_API_ID, TELEGRAM_API_HASH)
+    await tg_monitor(telegram_client, pipeline.publish)
 
 # Main asynchronous routine: run all components concurrently.
 async def main():
-    await asyncio.gather(
-        monitor_telegram(),
-        periodic_fetch_binance_announcements(),
-#        periodic_fetch_kraken_announcements(), # Kraken doesn't affect the market that well
-        periodic_fetch_coinbase_tweets()
-    )
+    await router.start()
+    try:
+        await asyncio.gather(
+            pipeline.run(report_interval=PIPELINE_REPORT_INTERVAL),
+            ticker_index.run([venue.engine for venue in router.venues], interval=TICKER_INDEX_REFRESH),
+            monitor_telegram(),
+            listing_watcher.run(),
+            latency_budget.run(report_interval=LATENCY_REPORT_INTERVAL),
+            periodic_fetch_binance_announcements(),
+#            periodic_fetch_kraken_announcements(), # Kraken doesn't affect the market that well
+            periodic_fetch_coinbase_tweets()
+        )
+    finally:
+        if exit_engine is not None:
+            await exit_engine.close()
+        await router.close()
+        journal.close()
+        state.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+# Allow running as `python benchmarks/bench_dedup.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from state.dedup import DedupStore
+
+WORDS = ["binance", "will", "list", "kraken", "available", "for", "trading", "launchpool", "token", "protocol",
+         "network", "finance", "seed", "tag", "applied", "perpetual", "margin", "futures", "with", "and"]
+
+def titles(n, seed=1):
+    """
+    n distinct normalized titles of roughly 70 characters.
+    """
+    rng = random.Random(seed)
+    for i in range(n):
+        words = []
+        while sum(len(w) + 1 for w in words) < 62:
+            words.append(rng.choice(WORDS))
+        yield f"{' '.join(words)} ({i:06d})"
+
+def retained_bytes(build, n):
+    """
+    Bytes still allocated after build() has consumed n generated titles.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(titles(n))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structure, after - before
+
+def build_set(items):
+    seen = set()
+    for title in items:
+        seen.add(title)
+    return seen
+
+def build_dedup(n, bloom_bits):
+    def build(items):
+        store = DedupStore("bench", max_entries=n, bloom_bits=bloom_bits)
+        for title in items:
+            store.add(title)
+        return store
+    return build
+
+def lookup_us(structure, n, repeat=3):
+    probes = list(titles(n // 2)) + list(titles(n // 2, seed=2))  # half seen, half unseen
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title in probes:
+            title in structure
+        best = min(best, time.perf_counter() - start)
+    return best / len(probes) * 1e6
+
+def run(n=50000):
+    print(f"{n} titles of ~70 characters")
+    print("=" * 60)
+    for name, build in (("set", build_set), ("dedup", build_dedup(n, 0)),
+                        ("dedup+bloom", build_dedup(n, 1 << 20))):
+        structure, size = retained_bytes(build, n)
+        print(f"{name:>12}: {size / 2 ** 20:6.2f} MiB ({size / n:5.1f} B/title)   "
+              f"{lookup_us(structure, n):5.2f} us/lookup")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
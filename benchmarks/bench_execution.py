@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import asyncio
+import logging
+import tempfile
+from collections import Counter
+
+# Allow running as `python benchmarks/bench_execution.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.claims import SymbolClaims
+from execution.ratelimit import GATE_IO_LIMITS, RateLimiter
+from metrics.latency import percentiles
+
+LISTED = ["AAA", "BBB", "CCC", "DDD"]
+# Announcements as extracted symbol lists; ZZZ is never listed and must not be ordered.
+ANNOUNCEMENTS = [["AAA"], ["BBB", "CCC"], ["DDD", "ZZZ"], ["AAA", "BBB", "CCC", "DDD"]]
+SCENARIOS = [
+    ("fast, reliable", dict(latency=0.02, latency_sigma=0.2, error_rate=0.0)),
+    ("slow, jittery", dict(latency=0.08, latency_sigma=0.6, error_rate=0.0)),
+    ("lossy", dict(latency=0.03, latency_sigma=0.3, error_rate=0.2)),
+]
+
+# Unthrottled, so the figures show pipeline and simulated exchange latency only.
+UNLIMITED = {endpoint: (10 ** 6, 10 ** 6) for endpoint in GATE_IO_LIMITS}
+
+def load_bot():
+    """
+    Imports algo against paper exchanges listing LISTED, with scratch state and
+    journal files and the exit engine off, as the journal replay does.
+    """
+    scratch = tempfile.mkdtemp(prefix="bench-execution-")
+    os.environ.update({
+        "PAPER_TRADING": "1",
+        "PAPER_MARKETS": ",".join(LISTED),
+        "PAPER_BALANCE": str(10 ** 9),
+        "EXIT_ENGINE": "0",
+        "EXTRA_VENUES": "",
+        "BOT_STATE_PATH": os.path.join(scratch, "state.db"),
+        "ANNOUNCEMENT_JOURNAL_PATH": os.path.join(scratch, "announcements.jsonl"),
+    })
+    import algo
+    algo.gateio_engine.limiter = RateLimiter(UNLIMITED)
+    return algo
+
+async def run_scenario(algo, options, rounds):
+    exchange = algo.gateio
+    for name, value in options.items():
+        setattr(exchange, name, value)
+    exchange.random.seed(1)
+    exchange.orders.clear()
+    detect_to_ack, counts = [], Counter()
+    for _ in range(rounds):
+        # Every round is a fresh listing: nothing executed, claimed or watched yet.
+        algo.processed_listings.clear()
+        algo.claims = SymbolClaims()
+        algo.listing_watcher.pending.clear()
+        for symbols in ANNOUNCEMENTS:
+            detected_at = time.time()
+            outcomes = await algo.execute_trades(symbols, detected_at=detected_at, source="bench")
+            acked = time.time() - detected_at
+            for outcome in outcomes.values():
+                counts[outcome] += 1
+                if outcome in ("filled", "partially filled"):
+                    detect_to_ack.append(acked)
+    unlisted_orders = [o for o in exchange.orders if o["symbol"].split("/")[0] not in LISTED]
+    return detect_to_ack, counts, unlisted_orders
+
+async def run_all(rounds):
+    algo = load_bot()
+    await algo.router.start()
+    try:
+        for name, options in SCENARIOS:
+            detect_to_ack, counts, unlisted_orders = await run_scenario(algo, options, rounds)
+            p = percentiles(detect_to_ack)
+            print(f"{name:>15}: detect->ack " + "  ".join(f"{k} {v * 1000:6.1f} ms" for k, v in p.items()))
+            print(f"{'':>15}  " + ", ".join(f"{outcome} {count}" for outcome, count in sorted(counts.items())))
+            if unlisted_orders:
+                print(f"{'':>15}  REGRESSION: {len(unlisted_orders)} orders for unlisted symbols")
+    finally:
+        await algo.router.close()
+        algo.journal.close()
+        algo.state.close()
+
+def run(rounds=20):
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run_all(rounds))
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import tracemalloc
+
+# Allow running as `python benchmarks/bench_extract.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.binance import BINANCE_EXTRACTORS
+from scrapers.kraken import KRAKEN_EXTRACTORS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CASES = [
+    ("binance", "binance_listing.html", BINANCE_EXTRACTORS),
+    ("kraken", "kraken_asset_listings.html", KRAKEN_EXTRACTORS),
+]
+
+def measure(extract, html, repeat):
+    """
+    Returns (best wall time in ms, peak traced memory in KiB) for extract(html).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(html)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    extract(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+def run(repeat=5):
+    for source, fixture, extractors in CASES:
+        with open(os.path.join(FIXTURES_DIR, fixture), encoding="utf-8") as f:
+            html = f.read()
+        reference = extractors["soup"](html)
+        print(f"\n{source}: {fixture} ({len(html) / 1024:.0f} KiB, {len(reference)} candidates)")
+        print("=" * 60)
+        for name, extract in extractors.items():
+            result = extract(html)
+            if result != reference:
+                print(f"{name:>6}: MISMATCH against soup output")
+                continue
+            ms, peak_kib = measure(extract, html, repeat)
+            print(f"{name:>6}: {ms:8.2f} ms   peak {peak_kib:9.0f} KiB")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,73 @@
+import os
+import re
+import sys
+import json
+import time
+
+# Allow running as `python benchmarks/bench_symbols.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from symbols.extract import SymbolEngine
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "symbol_corpus.jsonl")
+
+def legacy_extract(source, text):
+    """
+    The per-source parsing used before symbols.extract, kept as the baseline.
+    """
+    def binance(text):
+        return re.findall(r"\(([A-Z0-9]+)\)", text)
+
+    def kraken(text):
+        if "available for trading" not in text.lower():
+            return []
+        cleaned = re.sub(r'\s*(are|is)\s+available\s+for\s+trading[!\.]*', '', text, flags=re.IGNORECASE)
+        return [sub.strip().upper() for part in cleaned.split(',') for sub in part.split(' and ') if sub.strip()]
+
+    if source == "binance":
+        return binance(text)
+    if source == "kraken":
+        return kraken(text)
+    if source == "telegram":
+        lower_text = text.lower()
+        if not ("binance will list" in lower_text or "new listing" in lower_text or "available for trading" in lower_text):
+            return []
+        return binance(text) or kraken(text)
+    match = re.search(r'\(([A-Z]{3,6})\)', text)
+    return [match.group(1)] if match else []
+
+def engine_extract(engine):
+    def extract(source, text):
+        if source == "telegram" and not engine.trigger(text):
+            return []
+        return engine.extract(source, text)
+    return extract
+
+def measure(extract, corpus, repeat):
+    """
+    Returns (mismatched entries, best mean microseconds per message).
+    """
+    mismatches = [entry for entry in corpus if extract(entry["source"], entry["text"]) != entry["symbols"]]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for entry in corpus:
+            extract(entry["source"], entry["text"])
+        best = min(best, time.perf_counter() - start)
+    return mismatches, best / len(corpus) * 1e6
+
+def run(repeat=200):
+    with open(CORPUS, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    sources = sorted({entry["source"] for entry in corpus})
+    print(f"{len(corpus)} corpus entries ({', '.join(sources)})")
+    print("=" * 60)
+    for name, extract in (("legacy", legacy_extract), ("engine", engine_extract(SymbolEngine()))):
+        mismatches, us = measure(extract, corpus, repeat)
+        print(f"{name:>7}: {len(corpus) - len(mismatches)}/{len(corpus)} correct   {us:6.2f} us/message")
+        for entry in mismatches:
+            print(f"{'':>9}{entry['source']}: {entry['text'][:60]!r} -> {extract(entry['source'], entry['text'])}, "
+                  f"expected {entry['symbols']}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,119 @@
+import os
+import sys
+import asyncio
+import logging
+
+# Allow running as `python debug/debug_router.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.engine import ExecutionEngine
+from execution.router import ExecutionRouter, Venue
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class MockExchange:
+    """
+    Local stand-in for an async ccxt client: fixed markets and a fixed order latency.
+    Orders for symbols in `fail` always fail; orders for symbols in `flaky` fail
+    after the first one.
+    """
+    def __init__(self, exchange_id, bases, latency, fail=(), flaky=()):
+        self.id = exchange_id
+        self.options = {}
+        self.enableRateLimit = True
+        self.latency = latency
+        self.fail = set(fail)
+        self.flaky = set(flaky)
+        self.orders = []
+        self.markets = {
+            f"{base}/USDT": {"spot": True, "base": base, "quote": "USDT", "active": True,
+                             "limits": {"cost": {"min": 1}}, "precision": {}, "info": {}}
+            for base in bases
+        }
+
+    async def load_markets(self, reload=False):
+        return self.markets
+
+    async def fetch_time(self):
+        return 0
+
+    async def create_order(self, symbol, type, side, amount=None, price=None, params=None):
+        await asyncio.sleep(self.latency)
+        if symbol in self.fail or (symbol in self.flaky and any(o["symbol"] == symbol for o in self.orders)):
+            raise RuntimeError(f"{self.id} rejected {symbol}")
+        order = {"id": f"{self.id}-{len(self.orders)}", "symbol": symbol, "cost": (params or {}).get("cost")}
+        self.orders.append(order)
+        return order
+
+    async def close(self):
+        pass
+
+SYMBOLS = ["AAA", "BBB", "CCC", "DDD", "ZZZ"]
+
+def build_router(mode):
+    # CCC fails on slow; DDD fails on slow and fast accepts only one DDD order.
+    slow = MockExchange("slow", ["AAA", "BBB", "CCC", "DDD"], latency=0.08, fail=["CCC/USDT", "DDD/USDT"])
+    fast = MockExchange("fast", ["AAA", "CCC", "DDD"], latency=0.02, flaky=["DDD/USDT"])
+    venues = [Venue("slow", ExecutionEngine(slow), preference=2), Venue("fast", ExecutionEngine(fast), preference=1)]
+    return ExecutionRouter(venues, mode=mode)
+
+def summarize(result):
+    """
+    (venue, cost) per fill, or the exception type name for failed results and shares.
+    """
+    if isinstance(result, Exception):
+        return type(result).__name__
+    return [(venue, type(order).__name__ if isinstance(order, Exception) else order["cost"]) for venue, order in result]
+
+# Expected summaries per mode for the first and second round of orders.
+EXPECTED = {
+    "preferred": [{
+        "AAA": [("slow", 300)], "BBB": [("slow", 300)], "CCC": [("fast", 300)], "DDD": [("fast", 300)],
+        "ZZZ": "LookupError",
+    }, {
+        # fast now rejects DDD, so the order fails on both venues.
+        "AAA": [("slow", 300)], "BBB": [("slow", 300)], "CCC": [("fast", 300)], "DDD": "RuntimeError",
+        "ZZZ": "LookupError",
+    }],
+    "fastest": [{
+        # Unmeasured venues are tried by preference, which measures both.
+        "AAA": [("slow", 300)], "BBB": [("slow", 300)], "CCC": [("fast", 300)], "DDD": [("fast", 300)],
+        "ZZZ": "LookupError",
+    }, {
+        "AAA": [("fast", 300)], "BBB": [("slow", 300)], "CCC": [("fast", 300)], "DDD": "RuntimeError",
+        "ZZZ": "LookupError",
+    }],
+    "split": [{
+        # A failed share is re-placed on the venue that filled; DDD's retry is rejected.
+        "AAA": [("slow", 150), ("fast", 150)], "BBB": [("slow", 300)], "CCC": [("fast", 150), ("fast", 150)],
+        "DDD": [("fast", 150), ("slow", "RuntimeError")], "ZZZ": "LookupError",
+    }, {
+        "AAA": [("slow", 150), ("fast", 150)], "BBB": [("slow", 300)], "CCC": [("fast", 150), ("fast", 150)],
+        "DDD": "RuntimeError", "ZZZ": "LookupError",
+    }],
+}
+
+async def test_router():
+    for mode in ("preferred", "fastest", "split"):
+        router = build_router(mode)
+        await router.start()
+        try:
+            print(f"\nMode: {mode}")
+            print("=" * 40)
+            # The first round measures both venues, the second uses the measurements.
+            for expected in EXPECTED[mode]:
+                results = await router.buy_many(SYMBOLS, 300)
+                for symbol, result in zip(SYMBOLS, results):
+                    print(f"{symbol}: {summarize(result)}")
+                    assert summarize(result) == expected[symbol], f"{mode} {symbol}: expected {expected[symbol]}"
+                print("-" * 40)
+            print(f"Latency: {router.latency_report()}")
+        finally:
+            await router.close()
+    print("\nAll routing modes behaved as expected.")
+
+if __name__ == "__main__":
+    asyncio.run(test_router())
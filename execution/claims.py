@@ -0,0 +1,85 @@
+import time
+import asyncio
+import logging
+from collections import OrderedDict, deque
+
+class Claim:
+    """
+    One source's claim on a symbol. Followers await wait() for the winner's result.
+    """
+    def __init__(self, symbol, source, detected_at):
+        self.symbol = symbol
+        self.source = source
+        self.detected_at = detected_at
+        self.future = asyncio.get_running_loop().create_future()
+        self.reclaimable = False  # set when released without a fill
+
+    async def wait(self):
+        return await asyncio.shield(self.future)
+
+class SymbolClaims:
+    """
+    Single-flight per normalized symbol. claim() is synchronous, so the first
+    caller owns the symbol before any network call is awaited; later callers
+    get the same Claim and attach to its result. A claim released without a
+    fill (failed order, deferred listing) can be taken again. Every lost race
+    records the winner, the loser and the detection-time margin.
+    """
+    def __init__(self, maxlen=1000):
+        self.maxlen = maxlen
+        self.claims = OrderedDict()  # symbol -> Claim, oldest first
+        self.races = deque(maxlen=maxlen)  # (symbol, winner, loser, margin_s)
+
+    def claim(self, symbol, source=None, detected_at=None):
+        """
+        Returns (claim, won).
+        """
+        symbol = symbol.strip().upper()
+        detected_at = detected_at or time.time()
+        claim = self.claims.get(symbol)
+        if claim is not None and not (claim.future.done() and claim.reclaimable):
+            margin = detected_at - claim.detected_at
+            self.races.append((symbol, claim.source, source, margin))
+            logging.info(f"{symbol} already claimed by {claim.source}; {source} detected it {margin * 1000:.0f} ms later")
+            return claim, False
+        claim = Claim(symbol, source, detected_at)
+        self.claims[symbol] = claim
+        self.claims.move_to_end(symbol)
+        while len(self.claims) > self.maxlen:
+            oldest = next(iter(self.claims))
+            if not self.claims[oldest].future.done():
+                break
+            del self.claims[oldest]
+        return claim, True
+
+    def resolve(self, claim, result):
+        """
+        Completes a claim that filled; later claims on the symbol attach to it.
+        """
+        if not claim.future.done():
+            claim.future.set_result(result)
+
+    def release(self, claim, result=None):
+        """
+        Completes a claim without a fill so the symbol can be claimed again.
+        """
+        claim.reclaimable = True
+        if not claim.future.done():
+            claim.future.set_result(result)
+
+    def race_report(self):
+        report = {}
+        for symbol, winner, loser, margin in self.races:
+            entry = report.setdefault(winner, {"wins": 0, "margins_ms": []})
+            entry["wins"] += 1
+            entry["margins_ms"].append(margin * 1000)
+        for entry in report.values():
+            margins = sorted(entry.pop("margins_ms"))
+            entry["margin_p50_ms"] = margins[len(margins) // 2]
+            entry["margin_max_ms"] = margins[-1]
+        return report
+
+    def log_report(self):
+        for winner, entry in self.race_report().items():
+            logging.info(f"Claim races won by {winner}: {entry['wins']}, margin p50 {entry['margin_p50_ms']:.0f} ms, "
+                         f"max {entry['margin_max_ms']:.0f} ms")
@@ -0,0 +1,103 @@
+import time
+import asyncio
+import logging
+from execution.markets import MarketIndex
+from execution.ratelimit import RateLimiter
+
+class ExecutionEngine:
+    """
+    Places orders through an async ccxt client. Markets are loaded at start-up
+    into a background-refreshed MarketIndex and a lightweight request every
+    keepalive_interval seconds keeps the TLS connection warm, so an order is a
+    single non-blocking round trip. Requests are throttled by a local per-endpoint
+    RateLimiter instead of ccxt's serializing enableRateLimit, so several orders
+    can be in flight at once.
+    """
+    def __init__(self, exchange, keepalive_interval=30, market_refresh_interval=60, limiter=None, latency=None):
+        self.exchange = exchange
+        self.exchange.options['createMarketBuyOrderRequiresPrice'] = False
+        self.exchange.enableRateLimit = False
+        self.limiter = limiter or RateLimiter()
+        self.keepalive_interval = keepalive_interval
+        self.markets = MarketIndex(exchange, refresh_interval=market_refresh_interval)
+        self.latency = latency  # optional metrics.latency.LatencyBudget
+        self._keepalive_task = None
+
+    async def start(self):
+        await self.markets.start()
+        self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self.limiter.acquire("public")
+                await self.exchange.fetch_time()
+            except Exception as e:
+                logging.warning(f"{self.exchange.id} keepalive request failed: {e}")
+
+    async def market_buy(self, symbol, cost, detected_at=None):
+        """
+        Spends `cost` USDT on symbol at market. detected_at is the wall-clock
+        time the announcement was seen; detection, submit and ack times are logged.
+        """
+        market = f"{symbol}/USDT"
+        await self.limiter.acquire("spot_order")
+        logging.info(f"Placing market order for {market} on {self.exchange.id} with {cost} USDT")
+        submitted_at = time.time()
+        order = await self.exchange.create_order(
+            symbol=market,
+            type="market",
+            side="buy",
+            amount=None,
+            params={"cost": cost}
+        )
+        acked_at = time.time()
+        detect_to_submit = f"{(submitted_at - detected_at) * 1000:.1f} ms" if detected_at else "n/a"
+        logging.info(f"Order timing for {market}: detected {detected_at}, submitted {submitted_at:.6f}, "
+                     f"acked {acked_at:.6f} (detect->submit {detect_to_submit}, submit->ack {(acked_at - submitted_at) * 1000:.1f} ms)")
+        if self.latency is not None:
+            self.latency.record_order(detected_at, submitted_at, acked_at, order.get("timestamp"))
+        return order
+
+    async def market_sell(self, symbol, amount):
+        """
+        Sells `amount` of symbol at market and logs the submit->ack time.
+        """
+        market = f"{symbol}/USDT"
+        try:
+            amount = float(self.exchange.amount_to_precision(market, amount))
+        except Exception:
+            pass  # market not loaded yet; let the exchange round
+        await self.limiter.acquire("spot_order")
+        logging.info(f"Placing market sell for {amount} {market} on {self.exchange.id}")
+        submitted_at = time.time()
+        order = await self.exchange.create_order(symbol=market, type="market", side="sell", amount=amount)
+        logging.info(f"Sell timing for {market}: submit->ack {(time.time() - submitted_at) * 1000:.1f} ms")
+        return order
+
+    async def market_buy_many(self, symbols, cost, detected_at=None):
+        """
+        Submits market buys for all symbols concurrently. Returns a list aligned
+        with symbols holding each order or the exception it raised.
+        """
+        start = time.perf_counter()
+        ack_offsets = {}
+
+        async def buy(symbol):
+            order = await self.market_buy(symbol, cost, detected_at=detected_at)
+            ack_offsets[symbol] = time.perf_counter() - start
+            return order
+
+        results = await asyncio.gather(*(buy(symbol) for symbol in symbols), return_exceptions=True)
+        if len(ack_offsets) > 1:
+            acks = sorted(ack_offsets.values())
+            logging.info(f"Fan-out of {len(symbols)} orders: first ack {acks[0] * 1000:.1f} ms, "
+                         f"last ack {acks[-1] * 1000:.1f} ms, spread {(acks[-1] - acks[0]) * 1000:.1f} ms")
+        return results
+
+    async def close(self):
+        self.markets.stop()
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+        await self.exchange.close()
@@ -0,0 +1,179 @@
+import time
+import asyncio
+import logging
+from collections import deque
+
+class Position:
+    """
+    An open long position and its exit rules. Fractions are relative to the
+    entry price (take_profit=0.5 sells at +50%); 0 or None disables a rule.
+    The trailing stop follows the highest price seen since entry.
+    """
+    def __init__(self, symbol, amount, entry_price=None, take_profit=None, stop_loss=None, trailing_stop=None):
+        self.symbol = symbol
+        self.amount = amount
+        self.entry_price = entry_price
+        self.peak_price = entry_price
+        self.take_profit = take_profit
+        self.stop_loss = stop_loss
+        self.trailing_stop = trailing_stop
+        self.opened_at = time.time()
+        self.open = True
+        self.exit_attempts = 0
+
+    def update(self, price):
+        """
+        Feeds one tick; returns the exit reason or None.
+        """
+        if self.entry_price is None:
+            # Fill price unknown (e.g. a cost-based market order): the first tick is the entry.
+            self.entry_price = self.peak_price = price
+            return None
+        if price > self.peak_price:
+            self.peak_price = price
+        if self.take_profit and price >= self.entry_price * (1 + self.take_profit):
+            return "take-profit"
+        if self.stop_loss and price <= self.entry_price * (1 - self.stop_loss):
+            return "stop-loss"
+        if self.trailing_stop and price <= self.peak_price * (1 - self.trailing_stop):
+            return "trailing-stop"
+        return None
+
+class ExitEngine:
+    """
+    Manages exits for all open positions on one event loop. Each position has a
+    coroutine awaiting watch_ticker on a ccxt.pro client (subscriptions share the
+    exchange's websocket connection), evaluates its rules on every tick and sells
+    through the ExecutionEngine when one triggers. Tick-to-decision latency and
+    exchange-to-receive lag are kept for latency_summary().
+    """
+    def __init__(self, watch_exchange, engine, take_profit=None, stop_loss=None, trailing_stop=None,
+                 on_exit=None, max_exit_attempts=3, reconnect_delay=1, report_every=1000, quote="USDT"):
+        self.exchange = watch_exchange
+        self.engine = engine
+        self.take_profit = take_profit
+        self.stop_loss = stop_loss
+        self.trailing_stop = trailing_stop
+        self.on_exit = on_exit  # async on_exit(position, reason, order or exception)
+        self.max_exit_attempts = max_exit_attempts
+        self.reconnect_delay = reconnect_delay
+        self.report_every = report_every
+        self.quote = quote
+        self.positions = {}  # symbol -> Position
+        self.decision_latency = deque(maxlen=5000)  # seconds from tick receipt to decision
+        self.feed_lag = deque(maxlen=5000)  # seconds from exchange timestamp to receipt
+        self.ticks = 0
+        self._tasks = {}
+        self._opening = {}  # symbol -> asyncio.Lock held while a fill is added
+
+    async def _sellable_amount(self, symbol, order):
+        filled = order.get("filled") or order.get("amount")
+        try:
+            await self.engine.limiter.acquire("private")
+            balance = await self.engine.exchange.fetch_balance()
+            free = (balance.get(symbol) or {}).get("free")
+        except Exception as e:
+            logging.warning(f"Could not fetch {symbol} balance for exit sizing: {e}")
+            free = None
+        # Fees are taken from the bought asset, so the free balance can be below the fill.
+        if free and (not filled or free < filled):
+            return free
+        return filled
+
+    async def open(self, symbol, order):
+        """
+        Starts managing the position opened by `order` (a ccxt buy order), or
+        adds it to the open position. Fills of one symbol are added one at a
+        time, so concurrent fills (e.g. a re-placed split share) share a position.
+        """
+        async with self._opening.setdefault(symbol, asyncio.Lock()):
+            await self._open(symbol, order)
+
+    async def _open(self, symbol, order):
+        amount = await self._sellable_amount(symbol, order)
+        if not amount:
+            logging.error(f"Cannot manage exits for {symbol}: unknown position size in {order}")
+            return
+        entry_price = order.get("average") or order.get("price")
+        position = self.positions.get(symbol)
+        if position is not None and position.open:
+            position.amount += amount
+            logging.info(f"Added {amount} {symbol} to the open position ({position.amount} total)")
+            return
+        position = Position(symbol, amount, entry_price, self.take_profit, self.stop_loss, self.trailing_stop)
+        self.positions[symbol] = position
+        self._tasks[symbol] = asyncio.create_task(self._watch(position))
+        logging.info(f"Managing exits for {amount} {symbol} (entry {entry_price or 'first tick'}, take-profit {self.take_profit}, "
+                     f"stop-loss {self.stop_loss}, trailing {self.trailing_stop}); {len(self.positions)} open")
+
+    def _record(self, received, decided, ticker):
+        self.ticks += 1
+        self.decision_latency.append(decided - received)
+        if ticker.get("timestamp"):
+            self.feed_lag.append(time.time() - ticker["timestamp"] / 1000)
+        if self.report_every and self.ticks % self.report_every == 0:
+            logging.info(f"Exit engine latency after {self.ticks} ticks: {self.latency_summary()}")
+
+    async def _watch(self, position):
+        market = f"{position.symbol}/{self.quote}"
+        try:
+            while position.open:
+                try:
+                    ticker = await self.exchange.watch_ticker(market)
+                except Exception as e:
+                    logging.warning(f"{market} ticker stream error, resubscribing in {self.reconnect_delay}s: {e}")
+                    await asyncio.sleep(self.reconnect_delay)
+                    continue
+                received = time.perf_counter()
+                price = ticker.get("last") or ticker.get("bid")
+                if not price:
+                    continue
+                reason = position.update(price)
+                self._record(received, time.perf_counter(), ticker)
+                if reason:
+                    await self._exit(position, reason, price)
+        finally:
+            self._tasks.pop(position.symbol, None)
+
+    async def _exit(self, position, reason, price):
+        logging.info(f"{reason} for {position.symbol} at {price} (entry {position.entry_price}, peak {position.peak_price})")
+        try:
+            order = await self.engine.market_sell(position.symbol, position.amount)
+        except Exception as e:
+            position.exit_attempts += 1
+            logging.error(f"Exit order for {position.symbol} failed (attempt {position.exit_attempts}): {e}")
+            if position.exit_attempts < self.max_exit_attempts:
+                return
+            self._close(position)
+            if self.on_exit is not None:
+                await self.on_exit(position, reason, e)
+            return
+        self._close(position)
+        logging.info(f"Exited {position.symbol} on {reason}: {order}")
+        if self.on_exit is not None:
+            await self.on_exit(position, reason, order)
+
+    def _close(self, position):
+        position.open = False
+        if self.positions.get(position.symbol) is position:
+            del self.positions[position.symbol]
+
+    def latency_summary(self):
+        decisions = sorted(self.decision_latency)
+        lags = sorted(self.feed_lag)
+        if not decisions:
+            return {"ticks": self.ticks}
+        return {
+            "ticks": self.ticks,
+            "decision_p50_us": decisions[len(decisions) // 2] * 1e6,
+            "decision_p99_us": decisions[int(len(decisions) * 0.99)] * 1e6,
+            "decision_max_us": decisions[-1] * 1e6,
+            "feed_lag_p50_ms": lags[len(lags) // 2] * 1000 if lags else None,
+            "feed_lag_p99_ms": lags[int(len(lags) * 0.99)] * 1000 if lags else None,
+        }
+
+    async def close(self):
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        await self.exchange.close()
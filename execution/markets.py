@@ -0,0 +1,105 @@
+import time
+import asyncio
+import logging
+from collections import namedtuple
+
+MarketInfo = namedtuple("MarketInfo", "symbol base quote amount_precision price_precision min_cost status active buy_start")
+
+class MarketIndex:
+    """
+    In-memory index of an exchange's spot markets, refreshed in the background,
+    so tradability and order limits are checked locally before any order.
+    """
+    def __init__(self, exchange, refresh_interval=60):
+        self.exchange = exchange
+        self.refresh_interval = refresh_interval
+        self.markets = {}  # "BASE/QUOTE" -> MarketInfo
+        self.last_refreshed = None  # wall-clock time of the last successful refresh
+        self.refresh_latency = None  # seconds taken by the last successful refresh
+        self._refresh_task = None
+
+    async def refresh(self):
+        start = time.perf_counter()
+        markets = await self.exchange.load_markets(reload=True)
+        index = {}
+        for symbol, market in markets.items():
+            if not market.get("spot", True):
+                continue
+            info = market.get("info") or {}
+            limits = market.get("limits") or {}
+            precision = market.get("precision") or {}
+            index[symbol] = MarketInfo(
+                symbol=symbol,
+                base=market.get("base"),
+                quote=market.get("quote"),
+                amount_precision=precision.get("amount"),
+                price_precision=precision.get("price"),
+                min_cost=(limits.get("cost") or {}).get("min"),
+                status=info.get("trade_status"),
+                active=market.get("active") is not False,
+                buy_start=float(info["buy_start"]) if info.get("buy_start") else None,  # Gate.io, epoch seconds
+            )
+        self.markets = index
+        self.refresh_latency = time.perf_counter() - start
+        self.last_refreshed = time.time()
+        logging.info(f"Indexed {len(index)} {self.exchange.id} spot markets in {self.refresh_latency * 1000:.0f} ms")
+
+    async def refresh_pairs(self, bases, quote="USDT"):
+        """
+        Updates the trading status of the given pairs only, through Gate.io's
+        single-pair endpoint; other exchanges get a full refresh.
+        """
+        fetch_pair = getattr(self.exchange, "public_spot_get_currency_pairs_currency_pair", None)
+        if fetch_pair is None:
+            await self.refresh()
+            return
+        pairs = await asyncio.gather(*(fetch_pair({"currency_pair": f"{base}_{quote}"}) for base in bases),
+                                     return_exceptions=True)
+        for base, pair in zip(bases, pairs):
+            market = self.lookup(base, quote)
+            if isinstance(pair, Exception):
+                logging.warning(f"Error fetching {base}/{quote} status from {self.exchange.id}: {pair}")
+                continue
+            if market is None:
+                continue
+            status = pair.get("trade_status")
+            buy_start = float(pair["buy_start"]) if pair.get("buy_start") else market.buy_start
+            self.markets[market.symbol] = market._replace(status=status, active=status == "tradable", buy_start=buy_start)
+
+    async def start(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            logging.error(f"Error loading {self.exchange.id} market index; retrying in the background: {e}")
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logging.warning(f"Error refreshing {self.exchange.id} market index: {e}")
+
+    def lookup(self, base, quote="USDT"):
+        return self.markets.get(f"{base}/{quote}")
+
+    def check(self, base, cost, quote="USDT"):
+        """
+        Returns (ok, reason) for spending `cost` of quote on base (cost=None skips
+        the minimum check). Everything passes while the index has never been loaded.
+        """
+        if self.last_refreshed is None:
+            return True, "market index not loaded"
+        market = self.lookup(base, quote)
+        if market is None:
+            return False, f"{base}/{quote} is not listed on {self.exchange.id}"
+        if not market.active:
+            return False, f"{base}/{quote} is not tradable yet (status: {market.status})"
+        if market.min_cost is not None and cost is not None and cost < market.min_cost:
+            return False, f"{cost} {quote} is below the {market.min_cost} {quote} minimum for {base}/{quote}"
+        return True, "ok"
+
+    def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
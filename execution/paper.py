@@ -0,0 +1,135 @@
+import math
+import time
+import random
+import asyncio
+import logging
+import ccxt
+
+class PaperExchange:
+    """
+    Simulated stand-in for the async ccxt client subset the bot uses
+    (load_markets, fetch_time, fetch_tickers, fetch_balance, create_order,
+    amount_to_precision and the ccxt.pro watch_ticker). No request leaves the
+    machine.
+
+    Every call sleeps for a latency drawn from a log-normal distribution with
+    the given median (seconds) and sigma, and fails with ccxt.NetworkError at
+    error_rate. Prices follow a per-symbol random walk; market orders fill
+    immediately at the current price moved against the taker by slippage, with
+    fee_rate charged in the received asset as Gate.io does.
+    """
+    def __init__(self, exchange_id="paper", bases=(), quote="USDT", balance=10000, latency=0.05, latency_sigma=0.3,
+                 error_rate=0.0, slippage=0.002, fee_rate=0.002, volatility=0.002, tick_interval=0.5, min_cost=3, seed=None):
+        self.id = exchange_id
+        self.options = {}
+        self.enableRateLimit = False
+        self.quote = quote
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.slippage = slippage
+        self.fee_rate = fee_rate
+        self.volatility = volatility
+        self.tick_interval = tick_interval
+        self.min_cost = min_cost
+        self.random = random.Random(seed)
+        self.balances = {quote: float(balance)}
+        self.prices = {}  # "BASE/QUOTE" -> last price
+        self.orders = []
+        self.markets = {}
+        for base in bases:
+            self.list_market(base)
+
+    def list_market(self, base, price=None):
+        """
+        Opens BASE/QUOTE for trading, e.g. to simulate a listing going live.
+        """
+        symbol = f"{base}/{self.quote}"
+        self.prices[symbol] = price or round(self.random.uniform(0.05, 5), 4)
+        self.markets[symbol] = {
+            "symbol": symbol, "base": base, "quote": self.quote, "spot": True, "active": True,
+            "precision": {"amount": 0.0001, "price": 0.0001},
+            "limits": {"cost": {"min": self.min_cost}},
+            "info": {"trade_status": "tradable"},
+        }
+
+    async def _call(self, name):
+        delay = self.random.lognormvariate(math.log(self.latency), self.latency_sigma) if self.latency else 0
+        await asyncio.sleep(delay)
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise ccxt.NetworkError(f"{self.id} {name}: simulated network error")
+
+    def _step(self, symbol):
+        price = self.prices[symbol] * math.exp(self.random.gauss(0, self.volatility))
+        self.prices[symbol] = price
+        return price
+
+    def _ticker(self, symbol):
+        price = self._step(symbol)
+        spread = price * self.slippage / 2
+        return {"symbol": symbol, "timestamp": int(time.time() * 1000), "last": price,
+                "bid": price - spread, "ask": price + spread}
+
+    async def load_markets(self, reload=False):
+        await self._call("load_markets")
+        return dict(self.markets)
+
+    async def fetch_time(self):
+        await self._call("fetch_time")
+        return int(time.time() * 1000)
+
+    async def fetch_tickers(self, symbols=None):
+        await self._call("fetch_tickers")
+        return {symbol: self._ticker(symbol) for symbol in (symbols or self.prices) if symbol in self.prices}
+
+    async def fetch_balance(self):
+        await self._call("fetch_balance")
+        return {asset: {"free": amount, "used": 0.0, "total": amount} for asset, amount in self.balances.items()}
+
+    async def watch_ticker(self, symbol):
+        await asyncio.sleep(self.tick_interval)
+        if symbol not in self.prices:
+            raise ccxt.BadSymbol(f"{self.id} does not have market symbol {symbol}")
+        return self._ticker(symbol)
+
+    def amount_to_precision(self, symbol, amount):
+        precision = self.markets[symbol]["precision"]["amount"]
+        return str(math.floor(amount / precision) * precision)
+
+    async def create_order(self, symbol, type, side, amount=None, price=None, params=None):
+        await self._call("create_order")
+        if symbol not in self.markets:
+            raise ccxt.BadSymbol(f"{self.id} does not have market symbol {symbol}")
+        if type != "market":
+            raise ccxt.NotSupported(f"{self.id} only simulates market orders")
+        base = self.markets[symbol]["base"]
+        last = self._step(symbol)
+        if side == "buy":
+            fill_price = last * (1 + self.slippage)
+            cost = (params or {}).get("cost") or amount * fill_price
+            if cost > self.balances.get(self.quote, 0):
+                raise ccxt.InsufficientFunds(f"{self.id} balance too low for {cost} {self.quote}")
+            filled = cost / fill_price
+            fee = {"currency": base, "cost": filled * self.fee_rate}
+            self.balances[self.quote] -= cost
+            self.balances[base] = self.balances.get(base, 0) + filled - fee["cost"]
+        else:
+            fill_price = last * (1 - self.slippage)
+            if amount > self.balances.get(base, 0) + 1e-12:
+                raise ccxt.InsufficientFunds(f"{self.id} balance too low to sell {amount} {base}")
+            filled = amount
+            cost = filled * fill_price
+            fee = {"currency": self.quote, "cost": cost * self.fee_rate}
+            self.balances[base] -= filled
+            self.balances[self.quote] += cost - fee["cost"]
+        order = {
+            "id": f"{self.id}-{len(self.orders) + 1}", "symbol": symbol, "type": type, "side": side,
+            "status": "closed", "timestamp": int(time.time() * 1000), "amount": filled, "filled": filled,
+            "cost": cost, "average": fill_price, "price": fill_price, "fee": fee,
+        }
+        self.orders.append(order)
+        logging.info(f"Paper {side} on {self.id}: {filled:.6f} {symbol} at {fill_price:.6f} ({cost:.2f} {self.quote})")
+        return order
+
+    async def close(self):
+        pass
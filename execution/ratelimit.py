@@ -0,0 +1,45 @@
+import time
+import asyncio
+
+# Gate.io API v4 limits: spot order placement 10 requests/s per user; other
+# private and public endpoints 200 requests per 10 s.
+GATE_IO_LIMITS = {
+    "spot_order": (10, 10),
+    "private": (20, 200),
+    "public": (20, 200),
+}
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, bursts of up to `capacity`.
+    Waiters are served in FIFO order.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+class RateLimiter:
+    """
+    One TokenBucket per endpoint class, e.g. limiter.acquire("spot_order").
+    """
+    def __init__(self, limits=GATE_IO_LIMITS):
+        self.buckets = {endpoint: TokenBucket(rate, capacity) for endpoint, (rate, capacity) in limits.items()}
+
+    async def acquire(self, endpoint):
+        await self.buckets[endpoint].acquire()
@@ -0,0 +1,131 @@
+import time
+import asyncio
+import logging
+
+class Venue:
+    """
+    One exchange the router can send orders to: an ExecutionEngine (with its
+    market index) plus a static preference and a smoothed order-ack latency.
+    """
+    def __init__(self, name, engine, preference=0, latency_alpha=0.2):
+        self.name = name
+        self.engine = engine
+        self.preference = preference
+        self.latency_alpha = latency_alpha
+        self.ack_latency = None  # EWMA of submit->ack seconds
+        self.orders = 0
+        self.failures = 0
+
+    def record_ack(self, seconds):
+        self.orders += 1
+        if self.ack_latency is None:
+            self.ack_latency = seconds
+        else:
+            self.ack_latency += self.latency_alpha * (seconds - self.ack_latency)
+
+    def record_failure(self):
+        self.failures += 1
+
+class ExecutionRouter:
+    """
+    Routes each symbol to venues whose cached market index lists it.
+    mode="fastest" picks the lowest smoothed ack latency (unmeasured venues by
+    preference first so they get measured), "preferred" picks the highest
+    preference, and "split" divides the spend across all listing venues
+    concurrently, re-placing a failed share on a venue that filled. A failed
+    order falls through to the next candidate.
+    """
+    def __init__(self, venues, mode="fastest"):
+        if mode not in ("fastest", "preferred", "split"):
+            raise ValueError(f"Unknown routing mode: {mode}")
+        self.venues = venues
+        self.mode = mode
+
+    async def start(self):
+        await asyncio.gather(*(venue.engine.start() for venue in self.venues))
+
+    def candidates(self, symbol, cost):
+        """
+        Venues that list symbol and accept cost, best first for the current mode.
+        """
+        listing = [venue for venue in self.venues if venue.engine.markets.check(symbol, cost)[0]]
+        if self.mode == "fastest":
+            return sorted(listing, key=lambda v: (v.ack_latency is not None, v.ack_latency or 0, -v.preference))
+        return sorted(listing, key=lambda v: -v.preference)
+
+    async def _buy_on(self, venue, symbol, cost, detected_at):
+        start = time.perf_counter()
+        try:
+            order = await venue.engine.market_buy(symbol, cost, detected_at=detected_at)
+        except Exception:
+            venue.record_failure()
+            raise
+        venue.record_ack(time.perf_counter() - start)
+        return order
+
+    async def buy(self, symbol, cost, detected_at=None):
+        """
+        Places the order(s) for one symbol. Returns [(venue name, order)];
+        raises the last error when no venue filled. In split mode a failed
+        share is re-placed on a venue that filled its own share; a share that
+        still fails is returned as (venue name, exception).
+        """
+        if self.mode == "split":
+            venues = self.candidates(symbol, None)
+            venues = [venue for venue in venues if venue.engine.markets.check(symbol, cost / len(venues))[0]] if venues else []
+            if not venues:
+                raise LookupError(f"{symbol} is not listed on any venue")
+            share = cost / len(venues)
+            results = await asyncio.gather(*(self._buy_on(venue, symbol, share, detected_at) for venue in venues), return_exceptions=True)
+            filled = [(venue, result) for venue, result in zip(venues, results) if not isinstance(result, Exception)]
+            if not filled:
+                raise results[-1]
+            fills = [(venue.name, order) for venue, order in filled]
+            for venue, result in zip(venues, results):
+                if not isinstance(result, Exception):
+                    continue
+                logging.error(f"Split order for {symbol} failed on {venue.name}, re-placing its share: {result}")
+                for retry_venue, _ in filled:
+                    try:
+                        fills.append((retry_venue.name, await self._buy_on(retry_venue, symbol, share, detected_at)))
+                        break
+                    except Exception as e:
+                        logging.error(f"Re-placed share of {symbol} failed on {retry_venue.name}: {e}")
+                        result = e
+                else:
+                    fills.append((venue.name, result))
+            return fills
+        error = LookupError(f"{symbol} is not listed on any venue")
+        for venue in self.candidates(symbol, cost):
+            try:
+                return [(venue.name, await self._buy_on(venue, symbol, cost, detected_at))]
+            except Exception as e:
+                logging.error(f"Order for {symbol} failed on {venue.name}, trying next venue: {e}")
+                error = e
+        raise error
+
+    async def buy_many(self, symbols, cost, detected_at=None):
+        """
+        Routes all symbols concurrently; returns results aligned with symbols
+        (a list of (venue, order) or the exception raised).
+        """
+        start = time.perf_counter()
+        ack_offsets = []
+
+        async def route(symbol):
+            fills = await self.buy(symbol, cost, detected_at=detected_at)
+            ack_offsets.append(time.perf_counter() - start)
+            return fills
+
+        results = await asyncio.gather(*(route(symbol) for symbol in symbols), return_exceptions=True)
+        if len(ack_offsets) > 1:
+            logging.info(f"Fan-out of {len(symbols)} symbols: first ack {min(ack_offsets) * 1000:.1f} ms, "
+                         f"last ack {max(ack_offsets) * 1000:.1f} ms, spread {(max(ack_offsets) - min(ack_offsets)) * 1000:.1f} ms")
+        return results
+
+    def latency_report(self):
+        return {venue.name: {"ack_latency": venue.ack_latency, "orders": venue.orders, "failures": venue.failures}
+                for venue in self.venues}
+
+    async def close(self):
+        await asyncio.gather(*(venue.engine.close() for venue in self.venues), return_exceptions=True)
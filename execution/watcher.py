@@ -0,0 +1,121 @@
+import time
+import asyncio
+import logging
+
+def is_open(ticker):
+    """
+    A pair counts as open once its ticker shows a trade or a quote.
+    """
+    if not ticker:
+        return False
+    return any((ticker.get(field) or 0) > 0 for field in ("last", "bid", "ask"))
+
+class ListingWatcher:
+    """
+    Keeps announced symbols whose USDT pair is not trading yet and fires
+    on_open(symbol, detected_at) as soon as the pair opens. Every cycle makes a
+    single fetch_tickers request covering all pending symbols; entries expire
+    after ttl seconds and are reported through on_expire(symbol). With a
+    MarketIndex, a priced pair the index lists as inactive (Gate.io lists pairs
+    before they open) counts as open once its ticker has gone from no price to
+    a price since it was added, or once a buy_start that was still ahead at the
+    announcement has passed. A pair that showed a price from the start while
+    inactive (e.g. suspended) waits until its status turns tradable; only
+    those pairs' statuses are re-fetched, at most every
+    status_refresh_interval seconds.
+    """
+    def __init__(self, exchange, on_open, on_expire=None, poll_interval=0.5, ttl=6 * 3600, limiter=None, quote="USDT",
+                 markets=None, status_refresh_interval=5):
+        self.exchange = exchange
+        self.on_open = on_open
+        self.on_expire = on_expire
+        self.poll_interval = poll_interval
+        self.ttl = ttl
+        self.limiter = limiter
+        self.quote = quote
+        self.markets = markets
+        self.status_refresh_interval = status_refresh_interval
+        self.pending = {}  # symbol -> (expires_at monotonic, detected_at wall time)
+        self.unpriced = set()  # pending symbols whose ticker has shown no price since they were added
+        self._wake = asyncio.Event()
+        self._callbacks = set()
+        self._status_refreshed_at = None
+
+    def _spawn(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._callbacks.add(task)
+        task.add_done_callback(self._callbacks.discard)
+
+    def add(self, symbol, detected_at=None):
+        if symbol in self.pending:
+            return
+        self.pending[symbol] = (time.monotonic() + self.ttl, detected_at or time.time())
+        logging.info(f"Watching for {symbol}/{self.quote} to open on {self.exchange.id} ({len(self.pending)} pending)")
+        self._wake.set()
+
+    def _expire(self):
+        now = time.monotonic()
+        for symbol, (expires_at, _) in list(self.pending.items()):
+            if expires_at <= now:
+                del self.pending[symbol]
+                self.unpriced.discard(symbol)
+                logging.warning(f"Stopped watching {symbol}/{self.quote}: not open after {self.ttl}s")
+                if self.on_expire is not None:
+                    self._spawn(self.on_expire(symbol))
+
+    def _opened(self, symbol, detected_at):
+        market = self.markets.lookup(symbol, self.quote) if self.markets is not None else None
+        # A pair the index has never seen is new, so its ticker decides.
+        if market is None or market.active:
+            return True
+        if symbol in self.unpriced:
+            return True  # no price, then a price: the pair just opened
+        return market.buy_start is not None and detected_at < market.buy_start <= time.time()
+
+    async def _poll_once(self):
+        if self.limiter is not None:
+            await self.limiter.acquire("public")
+        tickers = await self.exchange.fetch_tickers()
+        seen_at = time.time()
+        guarded = []
+        for symbol in list(self.pending):
+            if not is_open(tickers.get(f"{symbol}/{self.quote}")):
+                self.unpriced.add(symbol)
+                continue
+            _, detected_at = self.pending[symbol]
+            if not self._opened(symbol, detected_at):
+                guarded.append(symbol)
+                continue
+            del self.pending[symbol]
+            self.unpriced.discard(symbol)
+            logging.info(f"{symbol}/{self.quote} opened on {self.exchange.id}; "
+                         f"{(seen_at - detected_at):.1f}s after the announcement")
+            self._spawn(self.on_open(symbol, detected_at))
+        if guarded:
+            self._refresh_status(guarded)
+
+    def _refresh_status(self, symbols):
+        now = time.monotonic()
+        if self._status_refreshed_at is not None and now - self._status_refreshed_at < self.status_refresh_interval:
+            return
+        self._status_refreshed_at = now
+        self._spawn(self._refresh_markets(symbols))
+
+    async def _refresh_markets(self, symbols):
+        try:
+            await self.markets.refresh_pairs(symbols, self.quote)
+        except Exception as e:
+            logging.warning(f"Error refreshing {self.exchange.id} status of pending listings: {e}")
+
+    async def run(self):
+        while True:
+            if not self.pending:
+                self._wake.clear()
+                await self._wake.wait()
+            self._expire()
+            if self.pending:
+                try:
+                    await self._poll_once()
+                except Exception as e:
+                    logging.warning(f"Error polling {self.exchange.id} tickers for pending listings: {e}")
+            await asyncio.sleep(self.poll_interval)
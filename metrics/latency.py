@@ -0,0 +1,111 @@
+import time
+import asyncio
+import logging
+from collections import deque, OrderedDict
+
+def percentiles(values, points=(50, 90, 99)):
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    return {f"p{p}": ordered[min(len(ordered) - 1, len(ordered) * p // 100)] for p in points}
+
+class ClockOffset:
+    """
+    Tracks exchange server time minus local wall time from fetch_time round
+    trips. The estimate comes from the lowest-RTT sample among the recent ones,
+    since a short round trip bounds the error of the midpoint assumption.
+    """
+    def __init__(self, exchange, limiter=None, samples=8):
+        self.exchange = exchange
+        self.limiter = limiter
+        self.samples = deque(maxlen=samples)  # (rtt_s, offset_s)
+        self.offset = 0.0
+        self.rtt = None
+
+    async def measure(self):
+        if self.limiter is not None:
+            await self.limiter.acquire("public")
+        sent = time.time()
+        server_ms = await self.exchange.fetch_time()
+        received = time.time()
+        self.samples.append((received - sent, server_ms / 1000 - (sent + received) / 2))
+        self.rtt, self.offset = min(self.samples)
+        return self.offset
+
+    def to_exchange(self, local_time):
+        return local_time + self.offset
+
+class LatencyBudget:
+    """
+    End-to-end latency per announcement source. detected() stamps an
+    announcement with its source-publish time (when the source provides one) and
+    local detection time; the ExecutionEngine reports submit/ack times of the
+    resulting orders against the same detected_at. Publish and exchange times
+    are compared on the exchange clock via ClockOffset.
+
+    - detection lag: publish -> local detection
+    - execution lag: local detection -> order ack
+    - submit lag: local submit -> exchange order timestamp (one-way to the exchange)
+    """
+    def __init__(self, clock, maxlen=1000):
+        self.clock = clock
+        self.maxlen = maxlen
+        self.detection = {}  # source -> deque of seconds
+        self.execution = {}
+        self.submit = {}
+        self._announcements = OrderedDict()  # detected_at -> source
+
+    def _add(self, table, source, value):
+        table.setdefault(source, deque(maxlen=self.maxlen)).append(value)
+
+    def detected(self, source, detected_at, published_at=None):
+        self._announcements[detected_at] = source
+        while len(self._announcements) > self.maxlen:
+            self._announcements.popitem(last=False)
+        if published_at:
+            lag = self.clock.to_exchange(detected_at) - published_at
+            self._add(self.detection, source, lag)
+            logging.info(f"{source} announcement detected {lag * 1000:.0f} ms after publication")
+
+    def record_order(self, detected_at, submitted_at, acked_at, exchange_timestamp=None):
+        source = self._announcements.get(detected_at, "unknown") if detected_at else "unknown"
+        if detected_at:
+            self._add(self.execution, source, acked_at - detected_at)
+        if exchange_timestamp:
+            self._add(self.submit, source, exchange_timestamp / 1000 - self.clock.to_exchange(submitted_at))
+
+    def report(self):
+        sources = set(self.detection) | set(self.execution)
+        return {
+            source: {
+                "detection": percentiles(self.detection.get(source, ())),
+                "execution": percentiles(self.execution.get(source, ())),
+                "submit": percentiles(self.submit.get(source, ())),
+            }
+            for source in sorted(sources)
+        }
+
+    def log_report(self):
+        for source, figures in self.report().items():
+            parts = []
+            for name, values in figures.items():
+                if values:
+                    parts.append(f"{name} " + "/".join(f"{v * 1000:.0f}" for v in values.values()) + " ms")
+            logging.info(f"Latency budget for {source} (p50/p90/p99): {', '.join(parts)}")
+
+    async def run(self, offset_interval=300, report_interval=3600):
+        """
+        Re-measures the clock offset every offset_interval seconds and logs the
+        report every report_interval seconds.
+        """
+        last_report = time.monotonic()
+        while True:
+            try:
+                offset = await self.clock.measure()
+                logging.info(f"{self.clock.exchange.id} clock offset {offset * 1000:+.1f} ms (rtt {self.clock.rtt * 1000:.1f} ms)")
+            except Exception as e:
+                logging.warning(f"Error measuring {self.clock.exchange.id} clock offset: {e}")
+            if time.monotonic() - last_report >= report_interval:
+                self.log_report()
+                last_report = time.monotonic()
+            await asyncio.sleep(offset_interval)
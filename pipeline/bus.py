@@ -0,0 +1,140 @@
+import time
+import asyncio
+import logging
+from collections import deque
+
+class AnnouncementEvent:
+    """
+    One raw announcement as published by a source. Stages fill in symbols and
+    the extracted names that did not resolve to a ticker. Detection is stamped
+    as wall-clock nanoseconds (detected_time_ns, with detected_at in seconds)
+    and perf_counter nanoseconds (detected_ns).
+    """
+    __slots__ = ("source", "text", "href", "norm", "detected_at", "detected_time_ns", "detected_ns", "published_at",
+                 "symbols", "unresolved")
+
+    def __init__(self, source, text, href=None, norm=None, detected_at=None, published_at=None, detected_time_ns=None):
+        self.source = source
+        self.text = text
+        self.href = href
+        self.norm = norm if norm is not None else text.strip().lower()
+        if detected_time_ns is None:
+            detected_time_ns = int(detected_at * 1e9) if detected_at else time.time_ns()
+        self.detected_time_ns = detected_time_ns
+        self.detected_at = detected_at or detected_time_ns / 1e9
+        self.detected_ns = time.perf_counter_ns()
+        self.published_at = published_at
+        self.symbols = []
+        self.unresolved = []
+
+    def __repr__(self):
+        return f"AnnouncementEvent({self.source!r}, {self.text!r}, symbols={self.symbols!r})"
+
+class Stage:
+    """
+    A bounded queue served by `workers` coroutines running handler(item). A
+    handler returns the item to pass to the downstream stages or None to stop
+    it there. Stages created with drop_when_full discard new items instead of
+    making producers wait.
+    """
+    def __init__(self, name, handler, workers=1, maxsize=100, drop_when_full=False, maxlen=1000):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.drop_when_full = drop_when_full
+        self.queue = asyncio.Queue(maxsize)
+        self.downstream = []
+        self.service_times = deque(maxlen=maxlen)
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def offer(self, item):
+        """
+        Enqueues without waiting; returns False if the item was dropped.
+        """
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logging.warning(f"Pipeline stage {self.name} is full ({self.queue.maxsize}); dropped {item!r}")
+            return False
+
+    async def put(self, item):
+        if self.drop_when_full:
+            self.offer(item)
+        else:
+            await self.queue.put(item)
+
+    async def _work(self):
+        while True:
+            item = await self.queue.get()
+            start = time.perf_counter()
+            try:
+                result = await self.handler(item)
+            except Exception as e:
+                self.errors += 1
+                logging.error(f"Pipeline stage {self.name} failed on {item!r}: {e}")
+                result = None
+            self.service_times.append(time.perf_counter() - start)
+            self.processed += 1
+            self.queue.task_done()
+            if result is not None:
+                for stage in self.downstream:
+                    await stage.put(result)
+
+    def stats(self):
+        times = sorted(self.service_times)
+        return {
+            "depth": self.queue.qsize(),
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "service_p50_ms": times[len(times) // 2] * 1000 if times else None,
+            "service_p99_ms": times[int(len(times) * 0.99)] * 1000 if times else None,
+        }
+
+class Pipeline:
+    """
+    Stages connected into a graph and run concurrently on the event loop.
+    publish() feeds the first stage and waits when it is full, so a busy
+    pipeline slows producers down instead of growing without bound.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self.reporters = []  # extra callables run with every stats report
+        self._tasks = []
+
+    def stage(self, name, handler, after=(), **options):
+        stage = Stage(name, handler, **options)
+        for upstream in ([after] if isinstance(after, str) else after):
+            self.stages[upstream].downstream.append(stage)
+        self.stages[name] = stage
+        return stage
+
+    async def publish(self, event):
+        await next(iter(self.stages.values())).put(event)
+
+    def stats(self):
+        return {name: stage.stats() for name, stage in self.stages.items()}
+
+    def log_stats(self):
+        for name, s in self.stats().items():
+            service = f"{s['service_p50_ms']:.1f}/{s['service_p99_ms']:.1f} ms" if s["processed"] else "n/a"
+            logging.info(f"{self.name} pipeline stage {name}: depth {s['depth']}, processed {s['processed']}, "
+                         f"dropped {s['dropped']}, errors {s['errors']}, service p50/p99 {service}")
+
+    async def run(self, report_interval=600):
+        for stage in self.stages.values():
+            self._tasks.extend(asyncio.create_task(stage._work()) for _ in range(stage.workers))
+        try:
+            while True:
+                await asyncio.sleep(report_interval)
+                self.log_stats()
+                for reporter in self.reporters:
+                    reporter()
+        finally:
+            for task in self._tasks:
+                task.cancel()
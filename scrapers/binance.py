@@ -1,12 +1,15 @@
-import time
 import logging
-import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from functools import partial
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
+from scrapers.extract import fast_anchors, script_anchors, soup_anchors
+from scrapers.source import AnnouncementSource
+from scrapers.browser import build_chrome_driver, chrome_rss_bytes
+from scrapers.driver_pool import DriverPool
+from scrapers.fingerprint import UNCHANGED_PAGE, page_fingerprint
+from scrapers.readiness import ReadinessRecorder, timed_get, wait_until_populated
+from symbols.extract import parenthesized_symbols
 
 # Configure logging (writes to the main log file)
 logging.basicConfig(
@@ -15,41 +18,104 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Binance CMS endpoint that backs the announcement list page.
+BINANCE_ANNOUNCEMENT_API = "https://www.binance.com/bapi/composite/v1/public/cms/article/list/query"
+
+# Announcement list container on the listing page and the anchors inside it.
+BINANCE_CONTAINER_CLASS = "bn-flex flex-col gap-6 items-center noH5:items-start px-[15px] noH5:px-6 mt-4"
+BINANCE_HREF_FRAGMENT = "/en/support/announcement/"
+BINANCE_ANCHOR_SELECTOR = f'a[href*="{BINANCE_HREF_FRAGMENT}"]'
+BINANCE_LIST_SELECTOR = f'div[class="{BINANCE_CONTAINER_CLASS}"] {BINANCE_ANCHOR_SELECTOR}'
+
+# page_source -> [(anchor text, href)]; "soup" builds the full tree, "fast" streams.
+# extractor="script" skips page_source and runs script_anchors in the page instead.
+BINANCE_EXTRACTORS = {
+    "soup": partial(soup_anchors, container_class=BINANCE_CONTAINER_CLASS, href_fragment=BINANCE_HREF_FRAGMENT),
+    "fast": partial(fast_anchors, container_class=BINANCE_CONTAINER_CLASS, href_fragment=BINANCE_HREF_FRAGMENT),
+}
+
 def extract_symbols(text):
     """
     Extracts symbols enclosed in parentheses.
     Example: "XYZ (ABC)" returns ["ABC"].
     """
-    return re.findall(r"\(([A-Z0-9]+)\)", text)
+    return parenthesized_symbols(text)
 
-class BinanceScraper:
+class BinanceScraper(AnnouncementSource):
     """
-    Scrapes Binance listing announcements using Selenium.
+    Scrapes Binance listing announcements.
+    mode="selenium" renders the announcement page in headless Chrome.
+    mode="http" queries the CMS list endpoint directly with conditional
+    requests and falls back to Selenium when the endpoint fails.
     """
-    def __init__(self, url):
+    name = "binance"
+    # href -> publish time (epoch seconds) of articles seen through the CMS endpoint,
+    # shared by all workers so callers can stamp announcements with it.
+    release_times = {}
+
+    def __init__(self, url, mode="selenium", catalog_id=48, page_size=20, http_timeout=5, ready_timeout=10, extractor="fast", lean=True):
+        super().__init__()
         self.url = url
-        self.driver = self._init_driver()
+        self.lean = lean
+        self.mode = mode
+        if extractor != "script" and extractor not in BINANCE_EXTRACTORS:
+            raise ValueError(f"Unknown extractor: {extractor}")
+        self.extractor = extractor
+        self.extract_anchors = BINANCE_EXTRACTORS.get(extractor)
+        self.ready_timeout = ready_timeout
+        self.readiness = ReadinessRecorder("Binance")
+        self.catalog_id = catalog_id
+        self.page_size = page_size
+        self.http_timeout = http_timeout
+        self.pool = self._init_pool() if mode == "selenium" else None
+        self.session = self._init_session() if mode == "http" else None
+        self._etag = None
+        self._last_modified = None
+        self._cached_announcements = []
+
+    def _init_session(self):
+        session = requests.Session()
+        # One keep-alive connection is reused across polls; no urllib3 retries so
+        # failures surface immediately and trigger the Selenium fallback.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Accept": "application/json",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+            "clienttype": "web",
+            "lang": "en",
+        })
+        return session
+
+    @property
+    def driver(self):
+        return self.pool.active if self.pool is not None else None
+
+    def _init_pool(self):
+        return DriverPool("Binance", self._init_driver)
 
     def _init_driver(self):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.page_load_strategy = "eager"
-        return webdriver.Chrome(options=chrome_options)
+        return build_chrome_driver(lean=self.lean)
 
     def refresh_page(self):
         try:
-            self.driver.get(self.url)
-            # Wait until at least one announcement anchor is present.
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/en/support/announcement/')]"))
+            driver = self.pool.acquire()
+            load_s = timed_get(driver, self.url)
+            # Return as soon as the announcements container holds anchors.
+            ready_s, anchor_count = wait_until_populated(
+                driver, BINANCE_LIST_SELECTOR, timeout=self.ready_timeout,
+                fallback_selector=BINANCE_ANCHOR_SELECTOR
             )
-            # Scroll half-way to load the announcements container.
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(2)
-            return self.driver.page_source
+            self.readiness.record(load_s, ready_s, chrome_rss_bytes(driver))
+            if ready_s is None and anchor_count == 0:
+                raise TimeoutException("no announcement anchors rendered")
+            self.pool.page_done()
+            if not self.fingerprint.update(page_fingerprint(driver, BINANCE_LIST_SELECTOR, BINANCE_ANCHOR_SELECTOR)):
+                return UNCHANGED_PAGE
+            self.fingerprint.extraction_started()
+            if self.extractor == "script":
+                return script_anchors(driver, BINANCE_CONTAINER_CLASS, BINANCE_HREF_FRAGMENT)
+            return driver.page_source
         except Exception as e:
             logging.error(f"Error refreshing Binance page: {e}")
             self.reinit_driver()
@@ -57,29 +123,90 @@ class BinanceScraper:
 
     def reinit_driver(self):
         try:
-            self.driver.quit()
+            self.pool.failover("page error")
         except Exception as e:
-            logging.error(f"Error quitting Binance driver: {e}")
-        self.driver = self._init_driver()
+            logging.error(f"Error replacing Binance driver: {e}")
+
+    def fetch_api_announcements(self):
+        """
+        Fetches the announcement list from the CMS endpoint.
+        Returns the cached list when the server answers 304 Not Modified.
+        """
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        params = {"type": 1, "pageNo": 1, "pageSize": self.page_size, "catalogId": self.catalog_id}
+        response = self.session.get(BINANCE_ANNOUNCEMENT_API, params=params, headers=headers, timeout=self.http_timeout)
+        if response.status_code == 304:
+            self.fingerprint.mark_unchanged()
+            return self._cached_announcements
+        response.raise_for_status()
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        # Servers that ignore conditional headers still resend identical bodies.
+        if not self.fingerprint.update(response.content):
+            return self._cached_announcements
+        self.fingerprint.extraction_started()
+        catalogs = response.json()["data"]["catalogs"]
+        articles = []
+        for catalog in catalogs:
+            if catalog.get("catalogId") == self.catalog_id:
+                articles = catalog.get("articles") or []
+                break
+        announcements = []
+        seen = set()
+        for article in articles:
+            title = (article.get("title") or "").strip()
+            if "will list" not in title.lower():
+                continue
+            code = article.get("code")
+            if not code:
+                continue
+            href = f"https://www.binance.com/en/support/announcement/{code}"
+            if href in seen:
+                continue
+            seen.add(href)
+            normalized_title = title.strip().lower()
+            announcements.append((title, href, normalized_title))
+            if article.get("releaseDate"):
+                self.release_times[href] = article["releaseDate"] / 1000
+        self.fingerprint.extraction_finished()
+        self._cached_announcements = announcements
+        return announcements
 
     def fetch_announcements(self):
-        html = self.refresh_page()
-        if not html:
+        if self.mode == "http":
+            try:
+                return self.fetch_api_announcements()
+            except Exception as e:
+                logging.error(f"Error fetching Binance announcements over HTTP, falling back to Selenium: {e}")
+                self.fingerprint.reset()
+                if self.pool is None:
+                    try:
+                        self.pool = self._init_pool()
+                    except Exception as e:
+                        logging.error(f"Error starting Binance fallback driver: {e}")
+                        self.fingerprint.mark_failed()
+                        return []
+        page = self.refresh_page()
+        if page is UNCHANGED_PAGE:
+            return self._cached_announcements
+        if page is None:
+            self.fingerprint.mark_failed()
+            return []
+        try:
+            anchors = page if self.extractor == "script" else self.extract_anchors(page)
+        except Exception as e:
+            logging.error(f"Error extracting Binance announcements: {e}")
+            self.fingerprint.mark_failed()
             return []
-        soup = BeautifulSoup(html, "html.parser")
-        # Locate the container holding announcements.
-        container = soup.find("div", class_="bn-flex flex-col gap-6 items-center noH5:items-start px-[15px] noH5:px-6 mt-4")
-        if container:
-            anchors = container.find_all("a", href=lambda h: h and "/en/support/announcement/" in h)
-        else:
-            anchors = soup.find_all("a", href=lambda h: h and "/en/support/announcement/" in h)
         announcements = []
         seen = set()
-        for a in anchors:
-            title = a.get_text(strip=True)
+        for title, href in anchors:
             if "will list" not in title.lower():
                 continue
-            href = a.get("href")
             if not href:
                 continue
             if href.startswith("/"):
@@ -89,10 +216,12 @@ class BinanceScraper:
             seen.add(href)
             normalized_title = title.strip().lower()
             announcements.append((title, href, normalized_title))
+        self.fingerprint.extraction_finished()
+        self._cached_announcements = announcements
         return announcements
 
     def quit(self):
-        try:
-            self.driver.quit()
-        except Exception as e:
-            logging.error(f"Error quitting Binance Selenium driver: {e}")
+        if self.session is not None:
+            self.session.close()
+        if self.pool is not None:
+            self.pool.quit()
@@ -0,0 +1,83 @@
+import logging
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+try:
+    import psutil
+except ImportError:  # Chrome RSS reporting is skipped without psutil
+    psutil = None
+
+# Chrome features the scrapers never use.
+LEAN_CHROME_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-notifications",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+]
+
+# Images, fonts and media by extension plus third-party analytics/tracking hosts.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*connect.facebook.*", "*hotjar.com*",
+    "*sentry.io*", "*segment.io*", "*segment.com*", "*clarity.ms*", "*bat.bing.com*",
+    "*analytics.tiktok.com*", "*ads-twitter.com*", "*intercom.io*", "*onetrust.com*",
+    "*cookielaw.org*", "*zendesk.com*", "*zdassets.com*", "*branch.io*", "*amplitude.com*",
+]
+BLOCKED_STYLESHEET_PATTERNS = ["*.css"]
+
+def build_chrome_driver(lean=True, block_stylesheets=False):
+    """
+    Starts headless Chrome; lean=True disables unused features and blocks
+    non-essential resources via CDP before the first page load.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.page_load_strategy = "eager"
+    if lean:
+        for argument in LEAN_CHROME_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+    driver = webdriver.Chrome(options=chrome_options)
+    if lean:
+        patterns = BLOCKED_URL_PATTERNS + (BLOCKED_STYLESHEET_PATTERNS if block_stylesheets else [])
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logging.error(f"Error enabling Chrome resource blocking: {e}")
+    return driver
+
+def chrome_rss_bytes(driver):
+    """
+    Resident memory of the chromedriver process tree (Chrome and its renderers),
+    or None when psutil is unavailable.
+    """
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        total = 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    except Exception:
+        return None
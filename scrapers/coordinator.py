@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import random
+from collections import deque
+
+class PollingCoordinator:
+    """
+    Runs several workers of the same announcement source with phase-offset
+    schedules so that together they sample every interval / workers seconds.
+    Results are merged into one stream; a result is dropped when a poll that
+    started later has already delivered announcements, so consumers only ever
+    move forward, and polls whose source reports an unchanged list are not
+    delivered at all.
+    With a scheduler, each round's length comes from scheduler.next_delay()
+    and the worker offsets are scaled to it.
+    """
+    def __init__(self, name, factory, workers=1, interval=10, offset_policy="even", report_every=60, scheduler=None):
+        self.name = name
+        self.factory = factory
+        self.workers = max(1, workers)
+        self.interval = interval
+        self.offset_policy = offset_policy
+        self.report_every = report_every
+        self.scheduler = scheduler
+        self.sources = []
+        self._tasks = []
+        self._triggers = []
+        self._results = asyncio.Queue()
+        self._last_delivered_start = None
+        self._poll_starts = deque(maxlen=200)
+        self._polls = 0
+        self.stale_dropped = 0
+
+    def phase_offsets(self):
+        """
+        Start offsets in seconds for each worker according to offset_policy.
+        """
+        if self.offset_policy == "even":
+            return [i * self.interval / self.workers for i in range(self.workers)]
+        if self.offset_policy == "random":
+            return sorted(random.uniform(0, self.interval) for _ in range(self.workers))
+        if self.offset_policy == "none":
+            return [0.0] * self.workers
+        raise ValueError(f"Unknown offset policy: {self.offset_policy}")
+
+    async def start(self):
+        # Sources (and their browsers) are started concurrently, off the loop.
+        self.sources = await asyncio.gather(*(asyncio.to_thread(self.factory) for _ in range(self.workers)))
+        self._triggers = [asyncio.Event() for _ in self.sources]
+        for index, source in enumerate(self.sources):
+            self._tasks.append(asyncio.create_task(self._run_worker(index, source)))
+        self._tasks.append(asyncio.create_task(self._run_rounds()))
+        logging.info(f"{self.name} polling with {self.workers} worker(s), interval {self.interval}s, offsets {self.offset_policy}")
+
+    async def _round_delay(self):
+        if self.scheduler is None:
+            return self.interval
+        await self.scheduler.maybe_relearn()
+        return self.scheduler.next_delay()
+
+    async def _run_rounds(self):
+        """
+        Starts every worker once per round. The round length comes from one
+        next_delay() call (jitter included), and worker i starts at its phase
+        offset scaled to that length, so the workers stay evenly staggered.
+        """
+        loop = asyncio.get_running_loop()
+        # Offsets as fractions of a round, drawn once so "random" phases stay put.
+        fractions = [offset / self.interval for offset in self.phase_offsets()] if self.interval else [0.0] * self.workers
+        round_start = loop.time()
+        while True:
+            delay = await self._round_delay()
+            for trigger, fraction in zip(self._triggers, fractions):
+                loop.call_at(round_start + fraction * delay, trigger.set)
+            # Fixed-rate rounds keep the phases; a worker still polling starts again at once.
+            round_start = max(round_start + delay, loop.time())
+            await asyncio.sleep(round_start - loop.time())
+
+    async def _run_worker(self, index, source):
+        loop = asyncio.get_running_loop()
+        trigger = self._triggers[index]
+        while True:
+            await trigger.wait()
+            trigger.clear()
+            started = loop.time()
+            logging.info(f"Refreshing {self.name} announcements (worker {index})...")
+            changed = True
+            try:
+                announcements = await source.fetch()
+                changed = source.last_changed
+            except Exception as e:
+                logging.error(f"Error in {self.name} worker {index}: {e}")
+                announcements = []
+            self._poll_starts.append(started)
+            self._polls += 1
+            if changed:
+                self._deliver(started, announcements)
+            self._maybe_report()
+            if self.scheduler is not None:
+                if announcements:
+                    self.scheduler.record_success()
+                else:
+                    self.scheduler.record_error()
+
+    def _deliver(self, started, announcements):
+        if self._last_delivered_start is not None and started < self._last_delivered_start:
+            self.stale_dropped += 1
+            return
+        # A failed or empty poll moves nothing forward, so it must not make an
+        # older in-flight poll that found announcements look stale.
+        if announcements:
+            self._last_delivered_start = started
+        self._results.put_nowait(announcements)
+
+    def _maybe_report(self):
+        if self._polls % self.report_every == 0:
+            logging.info(f"{self.name} achieved sampling interval: {self.sampling_interval():.2f}s "
+                         f"(target {self.interval / self.workers:.2f}s, stale dropped {self.stale_dropped})")
+
+    def sampling_interval(self):
+        """
+        Mean gap in seconds between the starts of recent polls across all workers.
+        """
+        if len(self._poll_starts) < 2:
+            return None
+        return (self._poll_starts[-1] - self._poll_starts[0]) / (len(self._poll_starts) - 1)
+
+    async def next_result(self):
+        """
+        Waits for the next merged list of (title, href, normalized_title) tuples.
+        """
+        return await self._results.get()
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*(source.close() for source in self.sources))
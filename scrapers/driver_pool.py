@@ -0,0 +1,104 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class DriverPool:
+    """
+    Holds the active Selenium driver plus a pre-spawned standby so a failing or
+    worn-out browser is swapped instantly instead of cold-starting Chrome inline.
+    The active driver is health-checked every health_interval seconds and
+    recycled after max_pages page loads or max_age seconds.
+    """
+    def __init__(self, name, factory, max_pages=500, max_age=3600, health_interval=30):
+        self.name = name
+        self.factory = factory
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.health_interval = health_interval
+        self._spawner = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-driver-spawn")
+        self._standby = None
+        self.active = self.factory()
+        self.active_started = time.monotonic()  # when the active driver was swapped in, not spawned
+        self.pages = 0
+        self._last_health_check = time.monotonic()
+        self._spawn_standby()
+
+    def _spawn_standby(self):
+        self._standby = self._spawner.submit(self.factory)
+
+    def _take_standby(self):
+        standby, self._standby = self._standby, None
+        if standby is not None:
+            try:
+                driver = standby.result()  # waits only if it is still starting
+                if self._is_healthy(driver):
+                    return driver
+                self._retire(driver)
+            except Exception as e:
+                logging.error(f"{self.name} standby driver failed to start: {e}")
+        return self.factory()
+
+    def _is_healthy(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _retire(self, driver):
+        def quit_driver():
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.error(f"Error quitting {self.name} driver: {e}")
+        threading.Thread(target=quit_driver, daemon=True).start()
+
+    def age(self):
+        return time.monotonic() - self.active_started
+
+    def acquire(self):
+        """
+        Returns a driver for the next page load, recycling or replacing the
+        active one when it is due or fails its health check.
+        """
+        now = time.monotonic()
+        if self.pages >= self.max_pages or self.age() >= self.max_age:
+            self.failover("recycle")
+        elif now - self._last_health_check >= self.health_interval:
+            self._last_health_check = now
+            if not self._is_healthy(self.active):
+                self.failover("health check failed")
+        return self.active
+
+    def page_done(self):
+        self.pages += 1
+
+    def failover(self, reason):
+        """
+        Swaps in the standby driver and starts a new standby in the background.
+        """
+        start = time.perf_counter()
+        old_driver, old_age, old_pages = self.active, self.age(), self.pages
+        self.active = self._take_standby()
+        # Age counts from the swap: a standby may have idled for a whole max_age.
+        self.active_started = time.monotonic()
+        self.pages = 0
+        self._last_health_check = time.monotonic()
+        self._spawn_standby()
+        self._retire(old_driver)
+        logging.info(f"{self.name} driver failover ({reason}) took {(time.perf_counter() - start) * 1000:.1f} ms; "
+                     f"retired driver age {old_age:.0f}s after {old_pages} pages")
+
+    def quit(self):
+        standby, self._standby = self._standby, None
+        if standby is not None:
+            try:
+                standby.result().quit()
+            except Exception as e:
+                logging.error(f"Error quitting {self.name} standby driver: {e}")
+        try:
+            self.active.quit()
+        except Exception as e:
+            logging.error(f"Error quitting {self.name} driver: {e}")
+        self._spawner.shutdown(wait=False)
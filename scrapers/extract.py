@@ -0,0 +1,293 @@
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup
+
+# Elements BeautifulSoup closes immediately (they never hold children).
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link",
+    "menuitem", "meta", "param", "source", "track", "wbr", "basefont", "bgsound",
+    "command", "frame", "image", "isindex", "nextid", "spacer",
+}
+# Strings inside these are not part of get_text() output.
+NON_TEXT_ELEMENTS = {"script", "style", "template"}
+
+def has_class(attrs, class_name):
+    """
+    Mirrors BeautifulSoup's class_ matching: a single class or the full class string.
+    """
+    value = attrs.get("class")
+    if not value:
+        return False
+    classes = value.split()
+    return class_name in classes or " ".join(classes) == class_name
+
+# In-page equivalents of the extractors below, run through driver.execute_script
+# so only the matched (text, href) pairs cross the WebDriver wire.
+SCRIPT_HELPERS = """
+const hasClass = (el, name) => {
+  const classes = (el.getAttribute('class') || '').split(/\\s+/).filter(Boolean);
+  return classes.includes(name) || classes.join(' ') === name;
+};
+const firstWithClass = (root, tag, name) => {
+  for (const el of root.getElementsByTagName(tag)) { if (hasClass(el, name)) return el; }
+  return null;
+};
+const strippedText = (el) => {
+  const parts = [];
+  const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT | NodeFilter.SHOW_CDATA_SECTION);
+  for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+    if (node.parentElement && node.parentElement.closest('script, style, template')) continue;
+    const text = node.nodeValue.trim();
+    if (text) parts.push(text);
+  }
+  return parts.join('');
+};
+"""
+ANCHORS_SCRIPT = SCRIPT_HELPERS + """
+const containerClass = arguments[0], hrefFragment = arguments[1];
+const scope = firstWithClass(document, 'div', containerClass) || document;
+const results = [];
+for (const a of scope.getElementsByTagName('a')) {
+  const href = a.getAttribute('href');
+  if (href && href.includes(hrefFragment)) results.push([strippedText(a), href]);
+}
+return results;
+"""
+ARTICLE_TITLES_SCRIPT = SCRIPT_HELPERS + """
+const containerClass = arguments[0];
+const scope = firstWithClass(document, 'div', containerClass) || document;
+const results = [];
+for (const article of scope.getElementsByTagName('article')) {
+  const title = firstWithClass(article, 'h2', 'title');
+  if (!title) continue;
+  const a = title.getElementsByTagName('a')[0];
+  if (!a) continue;
+  results.push([strippedText(a), a.getAttribute('href')]);
+}
+return results;
+"""
+
+def script_anchors(driver, container_class, href_fragment):
+    """
+    In-page equivalent of soup_anchors over the live DOM.
+    """
+    return [tuple(pair) for pair in driver.execute_script(ANCHORS_SCRIPT, container_class, href_fragment)]
+
+def script_article_titles(driver, container_class):
+    """
+    In-page equivalent of soup_article_titles over the live DOM.
+    """
+    return [tuple(pair) for pair in driver.execute_script(ARTICLE_TITLES_SCRIPT, container_class)]
+
+def soup_anchors(html, container_class, href_fragment):
+    """
+    Returns (text, href) for anchors whose href contains href_fragment, restricted
+    to the first div with container_class when it exists. Full-tree reference path.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    container = soup.find("div", class_=container_class)
+    scope = container if container else soup
+    anchors = scope.find_all("a", href=lambda h: h and href_fragment in h)
+    return [(a.get_text(strip=True), a.get("href")) for a in anchors]
+
+def soup_article_titles(html, container_class):
+    """
+    Returns (text, href) for the first anchor under the first h2.title of every
+    article, restricted to the first div with container_class when it exists.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    container = soup.find("div", class_=container_class)
+    scope = container if container else soup
+    results = []
+    for article in scope.find_all("article"):
+        title_el = article.find("h2", class_="title")
+        if not title_el:
+            continue
+        a_tag = title_el.find("a")
+        if not a_tag:
+            continue
+        results.append((a_tag.get_text(strip=True), a_tag.get("href")))
+    return results
+
+class _TargetedParser(HTMLParser):
+    """
+    Streaming parser that keeps only an open-element stack (with BeautifulSoup's
+    html.parser nesting rules) instead of building a tree. Subclasses hook
+    on_start/on_pop/on_text to collect just the elements they care about.
+    """
+    def __init__(self, container_class):
+        super().__init__(convert_charrefs=True)
+        self.container_class = container_class
+        self.stack = []
+        self.container_depth = None  # stack depth of the open container div
+        self.container_found = False
+        self.non_text_depth = 0
+        self._text = []
+
+    def in_container(self):
+        return self.container_depth is not None
+
+    def _flush_text(self):
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text = []
+            if text and not self.non_text_depth:
+                self.on_text(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        # Valueless attributes (<a href>) read back as "" in BeautifulSoup.
+        attrs = {name: "" if value is None else value for name, value in attrs}
+        if tag == "div" and not self.container_found and has_class(attrs, self.container_class):
+            self.container_found = True
+            self.container_depth = len(self.stack)
+        if tag in VOID_ELEMENTS:
+            self.on_start(tag, attrs, len(self.stack))
+            return
+        self.stack.append(tag)
+        if tag in NON_TEXT_ELEMENTS:
+            self.non_text_depth += 1
+        self.on_start(tag, attrs, len(self.stack) - 1)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag not in self.stack:
+            return
+        while self.stack:
+            name = self.stack.pop()
+            depth = len(self.stack)
+            if name in NON_TEXT_ELEMENTS:
+                self.non_text_depth -= 1
+            if self.container_depth is not None and depth <= self.container_depth:
+                self.container_depth = None
+            self.on_pop(depth)
+            if name == tag:
+                break
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    def unknown_decl(self, data):
+        self._flush_text()
+        # BeautifulSoup keeps CDATA sections as text nodes.
+        if data.upper().startswith("CDATA["):
+            self._text.append(data[6:])
+            self._flush_text()
+
+    def handle_data(self, data):
+        self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+    def on_start(self, tag, attrs, depth):
+        pass
+
+    def on_pop(self, depth):
+        pass
+
+    def on_text(self, text):
+        pass
+
+class AnchorParser(_TargetedParser):
+    """
+    Collects anchors whose href contains href_fragment, tagging each with
+    whether it sat inside the container div.
+    """
+    def __init__(self, container_class, href_fragment):
+        super().__init__(container_class)
+        self.href_fragment = href_fragment
+        self.anchors = []  # [text parts, href, in container]
+        self.open_anchors = []  # (depth, record)
+
+    def on_start(self, tag, attrs, depth):
+        if tag != "a":
+            return
+        href = attrs.get("href")
+        if not href or self.href_fragment not in href:
+            return
+        record = [[], href, self.in_container()]
+        self.anchors.append(record)
+        self.open_anchors.append((depth, record))
+
+    def on_pop(self, depth):
+        while self.open_anchors and self.open_anchors[-1][0] >= depth:
+            self.open_anchors.pop()
+
+    def on_text(self, text):
+        for _, record in self.open_anchors:
+            record[0].append(text)
+
+    def results(self):
+        scoped = [r for r in self.anchors if r[2]] if self.container_found else self.anchors
+        return [("".join(parts), href) for parts, href, _ in scoped]
+
+class ArticleTitleParser(_TargetedParser):
+    """
+    Collects the first anchor under the first h2.title of each article.
+    """
+    def __init__(self, container_class):
+        super().__init__(container_class)
+        self.articles = []  # dicts in document order
+        self.open_articles = []  # (depth, record)
+        self.open_titles = []  # (depth, record) for h2.title still open
+        self.open_anchors = []  # (depth, record) for title anchors still open
+
+    def on_start(self, tag, attrs, depth):
+        if tag == "article":
+            record = {"in_container": self.in_container(), "title_found": False, "has_anchor": False, "href": None, "parts": []}
+            self.articles.append(record)
+            self.open_articles.append((depth, record))
+        elif tag == "h2" and has_class(attrs, "title"):
+            for _, record in self.open_articles:
+                if not record["title_found"]:
+                    record["title_found"] = True
+                    self.open_titles.append((depth, record))
+        elif tag == "a":
+            for _, record in self.open_titles:
+                if not record["has_anchor"]:
+                    record["has_anchor"] = True
+                    record["href"] = attrs.get("href")
+                    self.open_anchors.append((depth, record))
+
+    def on_pop(self, depth):
+        for stack in (self.open_articles, self.open_titles, self.open_anchors):
+            while stack and stack[-1][0] >= depth:
+                stack.pop()
+
+    def on_text(self, text):
+        for _, record in self.open_anchors:
+            record["parts"].append(text)
+
+    def results(self):
+        scoped = [r for r in self.articles if r["in_container"]] if self.container_found else self.articles
+        return [("".join(r["parts"]), r["href"]) for r in scoped if r["has_anchor"]]
+
+def fast_anchors(html, container_class, href_fragment):
+    """
+    Streaming equivalent of soup_anchors.
+    """
+    parser = AnchorParser(container_class, href_fragment)
+    parser.feed(html)
+    parser.close()
+    return parser.results()
+
+def fast_article_titles(html, container_class):
+    """
+    Streaming equivalent of soup_article_titles.
+    """
+    parser = ArticleTitleParser(container_class)
+    parser.feed(html)
+    parser.close()
+    return parser.results()
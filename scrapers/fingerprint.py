@@ -0,0 +1,95 @@
+import time
+import hashlib
+import logging
+
+# Returns the href and text of the first k list anchors, computed in the page so
+# an unchanged list can be detected without transferring page_source.
+FINGERPRINT_SCRIPT = """
+const listSelector = arguments[0], fallbackSelector = arguments[1], k = arguments[2];
+let anchors = document.querySelectorAll(listSelector);
+if (!anchors.length) anchors = document.querySelectorAll(fallbackSelector);
+const parts = [];
+for (const a of anchors) {
+  if (parts.length >= k) break;
+  parts.push(a.getAttribute('href') + '\\t' + a.textContent.trim());
+}
+return parts.join('\\n');
+"""
+FINGERPRINT_TOP_K = 10
+
+# Returned by refresh_page() when the list fingerprint has not changed.
+UNCHANGED_PAGE = object()
+
+def page_fingerprint(driver, list_selector, fallback_selector, k=FINGERPRINT_TOP_K):
+    return driver.execute_script(FINGERPRINT_SCRIPT, list_selector, fallback_selector, k)
+
+class FingerprintTracker:
+    """
+    Tracks the announcement list fingerprint of a source and per-poll stats:
+    how many polls were unchanged vs changed and the extraction time skipped.
+    """
+    def __init__(self, name, report_every=100):
+        self.name = name
+        self.report_every = report_every
+        self.last_digest = None
+        self.last_changed = True
+        self.changed = 0
+        self.unchanged = 0
+        self.extraction_seconds = 0.0
+        self._extraction_start = None
+
+    def update(self, payload):
+        """
+        Records a poll's fingerprint payload (str or bytes); returns True if it changed.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self.last_digest:
+            self.mark_unchanged()
+            return False
+        self.last_digest = digest
+        self.last_changed = True
+        self.changed += 1
+        self._maybe_report()
+        return True
+
+    def mark_unchanged(self):
+        self.last_changed = False
+        self.unchanged += 1
+        self._maybe_report()
+
+    def mark_failed(self):
+        # Errors are passed on to the consumer rather than treated as "no change",
+        # and the fingerprint is forgotten so the next poll extracts the page again.
+        self.last_changed = True
+        self.reset()
+
+    def reset(self):
+        # Forget the last fingerprint, e.g. after a payload that failed to parse.
+        self.last_digest = None
+        self._extraction_start = None
+
+    def extraction_started(self):
+        self._extraction_start = time.perf_counter()
+
+    def extraction_finished(self):
+        if self._extraction_start is not None:
+            self.extraction_seconds += time.perf_counter() - self._extraction_start
+            self._extraction_start = None
+
+    def stats(self):
+        avg_extraction = self.extraction_seconds / self.changed if self.changed else 0.0
+        return {
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+            "avg_extraction_s": avg_extraction,
+            "time_saved_s": avg_extraction * self.unchanged,
+        }
+
+    def _maybe_report(self):
+        polls = self.changed + self.unchanged
+        if polls % self.report_every == 0:
+            stats = self.stats()
+            logging.info(f"{self.name} fingerprint: {stats['unchanged']} unchanged / {stats['changed']} changed polls, "
+                         f"~{stats['time_saved_s']:.2f}s extraction skipped")
@@ -1,12 +1,13 @@
-import time
 import logging
-import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from functools import partial
+from selenium.common.exceptions import TimeoutException
+from scrapers.extract import fast_article_titles, script_article_titles, soup_article_titles
+from scrapers.source import AnnouncementSource
+from scrapers.browser import build_chrome_driver, chrome_rss_bytes
+from scrapers.driver_pool import DriverPool
+from scrapers.fingerprint import UNCHANGED_PAGE, page_fingerprint
+from scrapers.readiness import ReadinessRecorder, timed_get, wait_until_populated
+from symbols.extract import name_list_symbols
 
 logging.basicConfig(
     filename='logs/crypto_bot.log',
@@ -14,50 +15,72 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Articles in the "latest" listing block, with any article as the fallback.
+KRAKEN_LIST_SELECTOR = "div.latest article h2.title a"
+KRAKEN_ARTICLE_SELECTOR = "article"
+KRAKEN_TITLE_SELECTOR = "article h2.title a"
+
+# page_source -> [(title text, href)]; "soup" builds the full tree, "fast" streams.
+# extractor="script" skips page_source and runs script_article_titles in the page instead.
+KRAKEN_EXTRACTORS = {
+    "soup": partial(soup_article_titles, container_class="latest"),
+    "fast": partial(fast_article_titles, container_class="latest"),
+}
+
 def extract_symbols_kraken(title):
     """
     Extracts symbols from Kraken announcements.
     Expected format: "AIXBT, ODOS and TOSHI are available for trading!"
     """
-    lower = title.lower()
-    if "available for trading" not in lower:
-        return []
-    cleaned = re.sub(r'\s*(are|is)\s+available\s+for\s+trading[!\.]*', '', title, flags=re.IGNORECASE)
-    parts = cleaned.split(',')
-    symbols = []
-    for part in parts:
-        for sub in part.split(' and '):
-            token = sub.strip()
-            if token:
-                symbols.append(token.upper())
-    return symbols
+    return name_list_symbols(title)
 
-class KrakenScraper:
+class KrakenScraper(AnnouncementSource):
     """
     Scrapes Kraken listing announcements using Selenium.
     """
-    def __init__(self, url):
+    name = "kraken"
+
+    def __init__(self, url, ready_timeout=10, extractor="fast", lean=True):
+        super().__init__()
         self.url = url
-        self.driver = self._init_driver()
+        self.lean = lean
+        if extractor != "script" and extractor not in KRAKEN_EXTRACTORS:
+            raise ValueError(f"Unknown extractor: {extractor}")
+        self.extractor = extractor
+        self.extract_titles = KRAKEN_EXTRACTORS.get(extractor)
+        self.ready_timeout = ready_timeout
+        self.readiness = ReadinessRecorder("Kraken")
+        self.pool = self._init_pool()
+        self._cached_announcements = []
+
+    @property
+    def driver(self):
+        return self.pool.active if self.pool is not None else None
+
+    def _init_pool(self):
+        return DriverPool("Kraken", self._init_driver)
 
     def _init_driver(self):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.page_load_strategy = "eager"
-        return webdriver.Chrome(options=chrome_options)
+        return build_chrome_driver(lean=self.lean)
 
     def refresh_page(self):
         try:
-            self.driver.get(self.url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//article"))
+            driver = self.pool.acquire()
+            load_s = timed_get(driver, self.url)
+            ready_s, article_count = wait_until_populated(
+                driver, KRAKEN_LIST_SELECTOR, timeout=self.ready_timeout,
+                fallback_selector=KRAKEN_ARTICLE_SELECTOR
             )
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(2)
-            return self.driver.page_source
+            self.readiness.record(load_s, ready_s, chrome_rss_bytes(driver))
+            if ready_s is None and article_count == 0:
+                raise TimeoutException("no articles rendered")
+            self.pool.page_done()
+            if not self.fingerprint.update(page_fingerprint(driver, KRAKEN_LIST_SELECTOR, KRAKEN_TITLE_SELECTOR)):
+                return UNCHANGED_PAGE
+            self.fingerprint.extraction_started()
+            if self.extractor == "script":
+                return script_article_titles(driver, "latest")
+            return driver.page_source
         except Exception as e:
             logging.error(f"Error refreshing Kraken page: {e}")
             self.reinit_driver()
@@ -65,41 +88,34 @@ class KrakenScraper:
 
     def reinit_driver(self):
         try:
-            self.driver.quit()
+            self.pool.failover("page error")
         except Exception as e:
-            logging.error(f"Error quitting Kraken driver: {e}")
-        self.driver = self._init_driver()
+            logging.error(f"Error replacing Kraken driver: {e}")
 
     def fetch_announcements(self):
-        html = self.refresh_page()
-        if not html:
+        page = self.refresh_page()
+        if page is UNCHANGED_PAGE:
+            return self._cached_announcements
+        if page is None:
+            self.fingerprint.mark_failed()
+            return []
+        try:
+            titles = page if self.extractor == "script" else self.extract_titles(page)
+        except Exception as e:
+            logging.error(f"Error extracting Kraken announcements: {e}")
+            self.fingerprint.mark_failed()
             return []
-        soup = BeautifulSoup(html, "html.parser")
-        container = soup.find("div", class_="latest")
-        if container:
-            articles = container.find_all("article")
-        else:
-            articles = soup.find_all("article")
         announcements = []
-        for article in articles:
-            title_el = article.find("h2", class_="title")
-            if not title_el:
-                continue
-            a_tag = title_el.find("a")
-            if not a_tag:
-                continue
-            title = a_tag.get_text(strip=True)
+        for title, href in titles:
             if "available for trading" not in title.lower():
                 continue
-            href = a_tag.get("href")
             if not href:
                 continue
             normalized_title = title.strip().lower()
             announcements.append((title, href, normalized_title))
+        self.fingerprint.extraction_finished()
+        self._cached_announcements = announcements
         return announcements
 
     def quit(self):
-        try:
-            self.driver.quit()
-        except Exception as e:
-            logging.error(f"Error quitting Kraken Selenium driver: {e}")
+        self.pool.quit()
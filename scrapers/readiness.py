@@ -0,0 +1,77 @@
+import time
+import logging
+from collections import deque
+
+# Resolves as soon as `selector` matches at least `minCount` elements, watching
+# DOM mutations instead of sleeping. Scrolls first so lazily rendered lists start
+# loading immediately. Calls back with [elapsed_ms or -1 on timeout, fallback_count].
+READY_SCRIPT = """
+const selector = arguments[0], minCount = arguments[1], timeoutMs = arguments[2], fallback = arguments[3];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+const ready = () => document.querySelectorAll(selector).length >= minCount;
+const finish = (elapsed) => done([elapsed, fallback ? document.querySelectorAll(fallback).length : 0]);
+window.scrollTo(0, document.body.scrollHeight / 2);
+if (ready()) { finish(performance.now() - start); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+  if (ready()) { observer.disconnect(); clearTimeout(timer); finish(performance.now() - start); }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true});
+timer = setTimeout(() => { observer.disconnect(); finish(-1); }, timeoutMs);
+"""
+
+def wait_until_populated(driver, selector, min_count=1, timeout=10, fallback_selector=None):
+    """
+    Blocks until the announcement list is rendered or `timeout` seconds pass.
+    Returns (elapsed seconds or None on timeout, number of fallback_selector matches).
+    """
+    driver.set_script_timeout(timeout + 2)
+    elapsed_ms, fallback_count = driver.execute_async_script(
+        READY_SCRIPT, selector, min_count, int(timeout * 1000), fallback_selector
+    )
+    if elapsed_ms < 0:
+        return None, fallback_count
+    return elapsed_ms / 1000, fallback_count
+
+class ReadinessRecorder:
+    """
+    Keeps recent per-poll page load, readiness and Chrome memory figures for a scraper.
+    """
+    def __init__(self, name, maxlen=500):
+        self.name = name
+        self.timings = deque(maxlen=maxlen)  # (load_s, ready_s or None, rss_bytes or None)
+        self.timeouts = 0
+
+    def record(self, load_s, ready_s, rss_bytes=None):
+        self.timings.append((load_s, ready_s, rss_bytes))
+        rss = f", Chrome RSS {rss_bytes / 1048576:.0f} MiB" if rss_bytes else ""
+        if ready_s is None:
+            self.timeouts += 1
+            logging.warning(f"{self.name} page not ready after load {load_s:.3f}s; readiness wait timed out{rss}")
+        else:
+            logging.info(f"{self.name} page ready: load {load_s:.3f}s, list populated after {ready_s:.3f}s{rss}")
+
+    def summary(self):
+        loads = sorted(t[0] for t in self.timings)
+        ready = sorted(t[1] for t in self.timings if t[1] is not None)
+        rss = sorted(t[2] for t in self.timings if t[2])
+        if not loads:
+            return {"polls": 0, "timeouts": self.timeouts}
+        return {
+            "polls": len(loads),
+            "timeouts": self.timeouts,
+            "load_p50": loads[len(loads) // 2],
+            "ready_p50": ready[len(ready) // 2] if ready else None,
+            "ready_max": ready[-1] if ready else None,
+            "rss_p50": rss[len(rss) // 2] if rss else None,
+            "rss_max": rss[-1] if rss else None,
+        }
+
+def timed_get(driver, url):
+    """
+    Navigates to url and returns the time spent in driver.get in seconds.
+    """
+    start = time.perf_counter()
+    driver.get(url)
+    return time.perf_counter() - start
@@ -0,0 +1,103 @@
+import os
+import re
+import time
+import random
+import asyncio
+import logging
+from datetime import datetime
+
+# Matches the asctime prefix written by logging.basicConfig in every module.
+LOG_LINE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ - \w+ - (.*)$")
+
+def load_announcement_times(log_path, message_pattern):
+    """
+    Returns datetimes of log lines whose message matches message_pattern.
+    """
+    if not os.path.exists(log_path):
+        return []
+    matcher = re.compile(message_pattern)
+    times = []
+    with open(log_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = LOG_LINE_PATTERN.match(line)
+            if match and matcher.search(match.group(2)):
+                times.append(datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S"))
+    return times
+
+class AdaptiveScheduler:
+    """
+    Chooses the delay before the next poll of a source. Learns an hour-of-day
+    histogram of past announcements and polls at hot_interval during hours that
+    see at least hot_ratio times their uniform share, cold_interval elsewhere,
+    and base_interval while there is no history. Delays get +/- jitter and back
+    off exponentially on consecutive errors.
+    """
+    def __init__(self, name, base_interval, hot_interval=None, cold_interval=None, jitter=0.1,
+                 hot_ratio=2.0, max_backoff=300, history=None, relearn_every=6 * 3600):
+        self.name = name
+        self.base_interval = base_interval
+        self.hot_interval = hot_interval if hot_interval is not None else base_interval
+        self.cold_interval = cold_interval if cold_interval is not None else base_interval
+        self.jitter = jitter
+        self.hot_ratio = hot_ratio
+        self.max_backoff = max_backoff
+        self.history = history
+        self.relearn_every = relearn_every
+        self.hot_hours = set()
+        self.samples = 0
+        self.consecutive_errors = 0
+        self._learned_at = None
+
+    def learn(self, timestamps):
+        counts = [0] * 24
+        for ts in timestamps:
+            counts[ts.hour] += 1
+        self.samples = sum(counts)
+        self._learned_at = time.monotonic()
+        if not self.samples:
+            self.hot_hours = set()
+            return
+        threshold = self.hot_ratio * self.samples / 24
+        self.hot_hours = {hour for hour, count in enumerate(counts) if count >= threshold}
+        logging.info(f"{self.name} scheduler learned {self.samples} announcements; hot hours: {sorted(self.hot_hours)}")
+
+    async def maybe_relearn(self):
+        """
+        Re-learns from history() when relearn_every has passed. history() reads
+        whole log files, so it runs in a worker thread instead of on the loop.
+        """
+        if self.history is None:
+            return
+        if self._learned_at is not None and time.monotonic() - self._learned_at < self.relearn_every:
+            return
+        # Claimed up front so concurrent workers do not read the history twice.
+        self._learned_at = time.monotonic()
+        try:
+            self.learn(await asyncio.to_thread(self.history))
+        except Exception as e:
+            logging.error(f"Error learning {self.name} announcement history: {e}")
+
+    def is_hot(self, when=None):
+        when = when or datetime.now()
+        return when.hour in self.hot_hours
+
+    def record_success(self):
+        self.consecutive_errors = 0
+
+    def record_error(self):
+        self.consecutive_errors += 1
+
+    def next_delay(self, when=None):
+        """
+        Seconds to wait before the next poll, from the hours learned by the last
+        maybe_relearn().
+        """
+        if self.consecutive_errors:
+            delay = min(self.base_interval * 2 ** self.consecutive_errors, self.max_backoff)
+        elif not self.samples:
+            delay = self.base_interval
+        elif self.is_hot(when):
+            delay = self.hot_interval
+        else:
+            delay = self.cold_interval
+        return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
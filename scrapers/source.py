@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from scrapers.fingerprint import FingerprintTracker
+
+class AnnouncementSource:
+    """
+    Base class for announcement sources polled from the asyncio loop.
+    Subclasses implement the blocking fetch_announcements() and quit();
+    fetch() and close() run them on a dedicated single-thread executor so one
+    source loading a page never stalls Telegram or the other sources.
+    Subclasses update self.fingerprint on each poll so consumers can skip
+    diffing when last_changed is False.
+    """
+    name = "source"
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}-source")
+        self.fingerprint = FingerprintTracker(self.name.capitalize())
+
+    @property
+    def last_changed(self):
+        return self.fingerprint.last_changed
+
+    def fetch_announcements(self):
+        raise NotImplementedError
+
+    def quit(self):
+        pass
+
+    async def fetch(self):
+        """
+        Returns the list of (title, href, normalized_title) tuples without blocking the loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.fetch_announcements)
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self.quit)
+        except Exception as e:
+            logging.error(f"Error closing {self.name} source: {e}")
+        finally:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,178 @@
+import sys
+import time
+import hashlib
+import logging
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+def key_hash(text):
+    """
+    64-bit blake2b digest of text as an int; stored instead of the full string.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 64-bit key hashes, probed with double hashing.
+    A negative answer is definite; a positive one may be false.
+    """
+    def __init__(self, bits=1 << 20, hashes=4):
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray((bits + 7) // 8)
+
+    def _positions(self, h):
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, h):
+        for p in self._positions(h):
+            self.array[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, h):
+        return all(self.array[p >> 3] & (1 << (p & 7)) for p in self._positions(h))
+
+    def clear(self):
+        self.array = bytearray(len(self.array))
+
+class DedupStore:
+    """
+    Set-like record of seen texts (`text in store`, `store.add(text)`) holding
+    8-byte hashes. Hashes seen recently go into a small open generation (a set);
+    when it spans ttl / generations seconds or holds max_entries / generations
+    hashes it is sealed into a sorted array('Q'), 8 bytes per hash, searched
+    with bisect. A hit re-adds the hash to the open generation, so a text lives
+    ttl seconds (plus at most one generation) after it was last seen. Whole
+    generations are dropped, oldest first, once expired or beyond max_entries.
+    An optional Bloom filter answers most negative lookups without touching the
+    generations; it is rebuilt from them once evictions have made it stale.
+    With a StateStore, hashes are persisted under "<name>_hashes" with the time
+    they were last seen and regrouped into generations on reload.
+    """
+    def __init__(self, name, ttl=365 * 86400, max_entries=50000, bloom_bits=1 << 20, bloom_hashes=4, store=None,
+                 generations=8):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation_span = ttl / generations
+        self.generation_size = max(1, max_entries // generations)
+        self.bloom = BloomFilter(bloom_bits, bloom_hashes) if bloom_bits else None
+        self.store = store
+        self.collection = f"{name}_hashes"
+        self.current = set()  # hashes of the open generation
+        self.current_opened = None  # wall-clock time the open generation got its first hash
+        self.current_last_seen = None
+        self.sealed = deque()  # (last seen, sorted array('Q') of hashes), oldest first
+        self.size = 0  # hashes across all generations
+        self.lookups = 0
+        self.hits = 0
+        self.bloom_negatives = 0
+        self.evictions = 0
+        self._stale = 0  # hashes evicted since the Bloom filter was last rebuilt
+        if store is not None:
+            # Rows come oldest first; replaying them rebuilds the generations. The
+            # store's copy is dropped so the hex keys are not held twice.
+            for key, seen in store.sets.pop(self.collection, {}).items():
+                self._insert(int(key, 16), seen)
+            self._evict(time.time())
+
+    def _seal(self):
+        if self.current:
+            self.sealed.append((self.current_last_seen, array("Q", sorted(self.current))))
+        self.current = set()
+        self.current_opened = None
+
+    def _insert(self, h, now):
+        if self.current_opened is not None and (now - self.current_opened >= self.generation_span
+                                                or len(self.current) >= self.generation_size):
+            self._seal()
+        if self.current_opened is None:
+            self.current_opened = now
+        if h not in self.current:
+            self.current.add(h)
+            self.size += 1
+        self.current_last_seen = now
+        if self.bloom is not None:
+            self.bloom.add(h)
+
+    def _evict(self, now):
+        if self.current and now - self.current_last_seen >= self.ttl:
+            self._seal()
+        while self.sealed and (now - self.sealed[0][0] >= self.ttl or self.size > self.max_entries):
+            last_seen, hashes = self.sealed.popleft()
+            if self.store is not None:
+                # Hashes seen again since are in newer generations with newer timestamps.
+                self.store.discard_before(self.collection, last_seen)
+            self.size -= len(hashes)
+            self.evictions += len(hashes)
+            self._stale += len(hashes)
+        if self.bloom is not None and self._stale > self.max_entries:
+            self.bloom.clear()
+            for h in self._hashes():
+                self.bloom.add(h)
+            self._stale = 0
+
+    def _hashes(self):
+        yield from self.current
+        for _, hashes in self.sealed:
+            yield from hashes
+
+    def _find(self, h):
+        if h in self.current:
+            return True
+        for _, hashes in reversed(self.sealed):
+            i = bisect_left(hashes, h)
+            if i < len(hashes) and hashes[i] == h:
+                return True
+        return False
+
+    def __contains__(self, text):
+        self.lookups += 1
+        h = key_hash(text)
+        if self.bloom is not None and h not in self.bloom:
+            self.bloom_negatives += 1
+            return False
+        now = time.time()
+        self._evict(now)
+        if not self._find(h):
+            return False
+        self.hits += 1
+        self._insert(h, now)
+        if self.store is not None:
+            self.store.touch(self.collection, f"{h:016x}")
+        return True
+
+    def add(self, text):
+        h = key_hash(text)
+        now = time.time()
+        if self.store is not None:
+            self.store.touch(self.collection, f"{h:016x}")
+        self._insert(h, now)
+        self._evict(now)
+
+    def __len__(self):
+        # Counts a hash once per generation it was seen in.
+        return self.size
+
+    def stats(self):
+        # Open generation: set table plus one int object per hash; sealed ones are packed arrays.
+        memory = (sys.getsizeof(self.current) + len(self.current) * sys.getsizeof(2 ** 63)
+                  + sum(sys.getsizeof(hashes) for _, hashes in self.sealed))
+        return {
+            "entries": len(self),
+            "generations": len(self.sealed) + 1,
+            "memory_bytes": memory,
+            "bloom_bytes": len(self.bloom.array) if self.bloom is not None else 0,
+            "lookups": self.lookups,
+            "hit_rate": self.hits / self.lookups if self.lookups else None,
+            "bloom_negatives": self.bloom_negatives,
+            "evictions": self.evictions,
+        }
+
+    def log_stats(self):
+        s = self.stats()
+        hit_rate = f"{s['hit_rate']:.1%}" if s["hit_rate"] is not None else "n/a"
+        logging.info(f"{self.name} dedup: {s['entries']} entries (~{s['memory_bytes'] / 1024:.0f} KiB, Bloom "
+                     f"{s['bloom_bytes'] / 1024:.0f} KiB), {s['lookups']} lookups, hit rate {hit_rate}, "
+                     f"{s['bloom_negatives']} answered by Bloom, {s['evictions']} evicted")
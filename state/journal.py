@@ -0,0 +1,178 @@
+import os
+import sys
+import json
+import time
+import queue
+import asyncio
+import logging
+import argparse
+import tempfile
+import threading
+from datetime import datetime
+
+class AnnouncementJournal:
+    """
+    Append-only JSON-lines record of every announcement event the pipeline
+    sees: source, raw text, href, publish and detection times (wall-clock and
+    perf_counter nanoseconds), extracted symbols and the decision taken.
+    record() only enqueues; a writer thread appends queued records, flushes
+    each batch and fsyncs every fsync_every records or fsync_interval seconds,
+    so the hot path never waits on disk.
+    """
+    def __init__(self, path="logs/announcements.jsonl", fsync_every=50, fsync_interval=1.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.records = 0
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, event, decision):
+        self._queue.put({
+            "source": event.source,
+            "text": event.text,
+            "href": event.href,
+            "published_at": event.published_at,
+            "detected_ns": event.detected_time_ns,
+            "detected_perf_ns": event.detected_ns,
+            "symbols": event.symbols,
+            "decision": decision,
+            "journaled_perf_ns": time.perf_counter_ns(),
+        })
+
+    def _write_loop(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            unsynced, last_sync = 0, time.monotonic()
+            while True:
+                try:
+                    batch = [self._queue.get(timeout=self.fsync_interval)]
+                except queue.Empty:
+                    batch = []
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in batch
+                lines = [json.dumps(item, ensure_ascii=False) + "\n" for item in batch if item is not None]
+                if lines:
+                    f.writelines(lines)
+                    f.flush()
+                    unsynced += len(lines)
+                    self.records += len(lines)
+                if unsynced and (stop or unsynced >= self.fsync_every or time.monotonic() - last_sync >= self.fsync_interval):
+                    os.fsync(f.fileno())
+                    unsynced, last_sync = 0, time.monotonic()
+                for _ in batch:
+                    self._queue.task_done()
+                if stop:
+                    return
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+
+def read_journal(path, source=None, symbol=None, decision=None, since=None):
+    """
+    Yields journal records, optionally filtered by source, symbol, decision
+    (substring of the recorded decision) and detection time (datetime).
+    """
+    since_ns = int(since.timestamp() * 1e9) if since else None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # partially written last line
+            if source and record["source"] != source:
+                continue
+            if symbol and symbol.upper() not in record["symbols"]:
+                continue
+            if decision and decision not in json.dumps(record["decision"]):
+                continue
+            if since_ns and record["detected_ns"] < since_ns:
+                continue
+            yield record
+
+def load_journal_times(path, sources=None):
+    """
+    Local detection datetimes of journaled announcements that were not dropped
+    before dedup, in the form scrapers.scheduler.AdaptiveScheduler learns from.
+    """
+    if not os.path.exists(path):
+        return []
+    return [datetime.fromtimestamp(record["detected_ns"] / 1e9) for record in read_journal(path)
+            if (sources is None or record["source"] in sources) and record["decision"] not in ("not-a-listing", "duplicate")]
+
+async def replay(records, speed=0.0):
+    """
+    Publishes records into the bot's announcement pipeline against paper
+    exchanges, logging notifications instead of sending them. Each replay
+    gets a fresh state database and journal in a new temporary directory, so
+    replaying the same records always starts from the same state. speed is a
+    playback rate: 1 keeps the recorded spacing, 2 halves it, 0 replays back
+    to back.
+    """
+    os.environ["PAPER_TRADING"] = "1"
+    # Keep replayed detections out of logs/crypto_bot.log, which the schedulers learn from.
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    scratch = tempfile.mkdtemp(prefix="journal-replay-")
+    os.environ["BOT_STATE_PATH"] = os.path.join(scratch, "state.db")
+    os.environ["ANNOUNCEMENT_JOURNAL_PATH"] = os.path.join(scratch, "announcements.jsonl")
+    os.environ.setdefault("EXIT_ENGINE", "0")
+    # List the journaled symbols on the paper exchange so their orders go through.
+    os.environ.setdefault("PAPER_MARKETS", ",".join(sorted({s for record in records for s in record["symbols"]})))
+    import algo
+    from pipeline.bus import AnnouncementEvent
+
+    async def log_notification(message):
+        logging.info(f"Replay notification (not sent): {message}")
+
+    algo.pipeline.stages["notify"].handler = log_notification
+    await algo.router.start()
+    algo.ticker_index.refresh([venue.engine for venue in algo.router.venues])
+    runner = asyncio.create_task(algo.pipeline.run(report_interval=3600))
+    previous = None
+    try:
+        for record in records:
+            if speed and previous is not None:
+                await asyncio.sleep(max(0, (record["detected_ns"] - previous) / 1e9 / speed))
+            previous = record["detected_ns"]
+            await algo.pipeline.publish(AnnouncementEvent(record["source"], record["text"], href=record["href"],
+                                                          published_at=record["published_at"]))
+        for stage in algo.pipeline.stages.values():
+            await stage.queue.join()
+        algo.pipeline.log_stats()
+    finally:
+        runner.cancel()
+        await algo.router.close()
+        algo.journal.close()
+        algo.state.close()
+    logging.info(f"Replay decisions journaled to {algo.ANNOUNCEMENT_JOURNAL_PATH}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Read, filter or replay the announcement journal.")
+    parser.add_argument("path", nargs="?", default=os.getenv("ANNOUNCEMENT_JOURNAL_PATH", "logs/announcements.jsonl"))
+    parser.add_argument("--source")
+    parser.add_argument("--symbol")
+    parser.add_argument("--decision", help="substring of the recorded decision, e.g. filled or duplicate")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="local time, e.g. 2025-03-01T12:00")
+    parser.add_argument("--replay", action="store_true", help="publish the matching records into the pipeline (paper trading)")
+    parser.add_argument("--speed", type=float, default=0.0, help="with --replay: playback rate, 1 keeps the recorded spacing, 2 is twice as fast, 0 replays back to back")
+    args = parser.parse_args(argv)
+    records = list(read_journal(args.path, args.source, args.symbol, args.decision, args.since))
+    if args.replay:
+        asyncio.run(replay(records, args.speed))
+        return
+    for record in records:
+        detected = datetime.fromtimestamp(record["detected_ns"] / 1e9).isoformat(timespec="milliseconds")
+        print(f"{detected}  {record['source']:<9} {','.join(record['symbols']) or '-':<14} "
+              f"{json.dumps(record['decision'])}  {record['text'][:80]!r}")
+    print(f"{len(records)} records", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
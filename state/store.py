@@ -0,0 +1,138 @@
+import time
+import queue
+import sqlite3
+import logging
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (collection, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pointers (
+    name TEXT PRIMARY KEY,
+    value TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+WRITES = {
+    "member": "INSERT OR IGNORE INTO members (collection, key, added_at) VALUES (?, ?, ?)",
+    # Members whose added_at tracks when they were last seen rather than first added.
+    "touch": "INSERT INTO members (collection, key, added_at) VALUES (?, ?, ?) "
+             "ON CONFLICT (collection, key) DO UPDATE SET added_at = excluded.added_at",
+    "discard": "DELETE FROM members WHERE collection = ? AND key = ?",
+    "discard_before": "DELETE FROM members WHERE collection = ? AND added_at <= ?",
+    "pointer": "INSERT OR REPLACE INTO pointers (name, value, updated_at) VALUES (?, ?, ?)",
+}
+
+class StateStore:
+    """
+    Bot state (processed sets and announcement pointers) in an SQLite WAL
+    database. Everything is read once at start-up; writes go through a queue to
+    a single writer thread that commits them in batches, so callers on the event
+    loop never wait on disk.
+    """
+    def __init__(self, path="bot_state.db", batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        start = time.perf_counter()
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        self.sets = {}  # collection -> {key: added_at}, oldest first; handed over and dropped on load
+        for collection, key, added_at in conn.execute("SELECT collection, key, added_at FROM members ORDER BY added_at"):
+            self.sets.setdefault(collection, {})[key] = added_at
+        self.pointers = dict(conn.execute("SELECT name, value FROM pointers"))
+        conn.close()
+        self.load_time = time.perf_counter() - start
+        logging.info(f"Loaded state from {path} in {self.load_time * 1000:.1f} ms: "
+                     f"{sum(len(s) for s in self.sets.values())} entries, {len(self.pointers)} pointers")
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="state-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            try:
+                for item in batch:
+                    if item:
+                        conn.execute(WRITES[item[0]], item[1:])
+                conn.commit()
+            except sqlite3.Error as e:
+                logging.error(f"Error writing {len(batch)} state updates to {self.path}: {e}")
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                conn.close()
+                return
+
+    def load_set(self, collection):
+        return PersistentSet(self, collection, self.sets.pop(collection, ()))
+
+    def get_pointer(self, name):
+        return self.pointers.get(name)
+
+    def set_pointer(self, name, value):
+        if self.pointers.get(name) == value:
+            return
+        self.pointers[name] = value
+        self._queue.put(("pointer", name, value, time.time()))
+
+    def add(self, collection, key):
+        self._queue.put(("member", collection, key, time.time()))
+
+    def touch(self, collection, key):
+        """
+        Adds key or moves its timestamp to now.
+        """
+        self._queue.put(("touch", collection, key, time.time()))
+
+    def discard(self, collection, key):
+        self._queue.put(("discard", collection, key))
+
+    def discard_before(self, collection, cutoff):
+        """
+        Removes the collection's members whose timestamp is at or before cutoff.
+        """
+        self._queue.put(("discard_before", collection, cutoff))
+
+    def flush(self):
+        """
+        Blocks until every queued write is committed.
+        """
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+
+class PersistentSet(set):
+    """
+    A set whose additions are also queued to its StateStore; membership checks
+    stay plain in-memory set lookups.
+    """
+    def __init__(self, store, collection, items=()):
+        super().__init__(items)
+        self.store = store
+        self.collection = collection
+
+    def add(self, key):
+        if key not in self:
+            super().add(key)
+            self.store.add(self.collection, key)
@@ -0,0 +1,80 @@
+import re
+
+# Listing phrases, matched case-insensitively by one compiled alternation.
+LISTING_TRIGGERS = ("binance will list", "new listing", "available for trading")
+
+class TriggerMatcher:
+    """
+    Finds any of several phrases in one pass. The phrases are compiled into a
+    single case-insensitive regex alternation (longest first), which runs in
+    re's C engine instead of one lower() plus a substring scan per phrase.
+    """
+    def __init__(self, phrases):
+        self.phrases = tuple(phrases)
+        alternation = "|".join(re.escape(p) for p in sorted(self.phrases, key=len, reverse=True))
+        self.pattern = re.compile(alternation, re.IGNORECASE)
+
+    def search(self, text):
+        """
+        Returns the first phrase found (lower-cased) or None.
+        """
+        match = self.pattern.search(text)
+        return match.group(0).lower() if match else None
+
+    def findall(self, text):
+        return {m.lower() for m in self.pattern.findall(text)}
+
+# Per-format symbol grammars: text -> [symbol].
+PARENTHESIZED_PATTERN = re.compile(r"\(([A-Z0-9]+)\)")
+AVAILABLE_PATTERN = re.compile(r"\s*(are|is)\s+available\s+for\s+trading[!\.]*", re.IGNORECASE)
+NAME_LIST_SEPARATOR = re.compile(r",| and ")
+TICKER_PATTERN = re.compile(r"\(([A-Z][A-Z0-9]{1,9})\)")
+
+def parenthesized_symbols(text):
+    """
+    Binance titles: "Binance Will List Walrus (WAL)" -> ["WAL"].
+    """
+    return PARENTHESIZED_PATTERN.findall(text)
+
+def name_list_symbols(text):
+    """
+    Kraken titles: "AIXBT, ODOS and TOSHI are available for trading!" ->
+    ["AIXBT", "ODOS", "TOSHI"].
+    """
+    cleaned, found = AVAILABLE_PATTERN.subn("", text)
+    if not found:
+        return []
+    return [token.strip().upper() for token in NAME_LIST_SEPARATOR.split(cleaned) if token.strip()]
+
+def ticker_symbols(text):
+    """
+    Coinbase tweets: parenthesized 2-10 character tickers starting with a
+    letter. "Story (IP) and Plume (PLUME)" -> ["IP", "PLUME"].
+    """
+    return TICKER_PATTERN.findall(text)
+
+# Grammars tried in order per source; the first that yields symbols wins.
+SOURCE_GRAMMARS = {
+    "binance": (parenthesized_symbols,),
+    "kraken": (name_list_symbols,),
+    "telegram": (parenthesized_symbols, name_list_symbols),
+    "coinbase": (ticker_symbols,),
+}
+
+class SymbolEngine:
+    """
+    Shared trigger matcher plus per-source symbol grammars.
+    """
+    def __init__(self, triggers=LISTING_TRIGGERS, grammars=SOURCE_GRAMMARS):
+        self.triggers = TriggerMatcher(triggers)
+        self.grammars = grammars
+
+    def trigger(self, text):
+        return self.triggers.search(text)
+
+    def extract(self, source, text):
+        for grammar in self.grammars.get(source, (parenthesized_symbols,)):
+            symbols = grammar(text)
+            if symbols:
+                return symbols
+        return []
@@ -0,0 +1,136 @@
+import re
+import time
+import asyncio
+import difflib
+import logging
+
+# Quote assets and network/token-standard labels that appear in parentheses or
+# name lists but are never the listed asset.
+DENY_LIST = frozenset({
+    "USDT", "USDC", "BUSD", "FDUSD", "TUSD", "DAI", "USD", "EUR", "TRY",
+    "BSC", "BNB CHAIN", "BEP20", "BEP2", "ERC20", "ERC-20", "TRC20", "SPL", "HRC20",
+})
+TICKER_SHAPE = re.compile(r"^[A-Z0-9]{2,10}$")
+
+def normalize_name(name):
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+class NameTrie:
+    """
+    Prefix trie over normalized asset names; each node keeps the tickers of
+    all names below it so completion is a walk down the prefix.
+    """
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, name, ticker):
+        node = self.root
+        for char in name:
+            node = node.setdefault(char, {})
+            node.setdefault("", set()).add(ticker)
+
+    def complete(self, prefix):
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return node.get("", set())
+
+class TickerIndex:
+    """
+    Known tickers (a set) and their asset names (dict plus NameTrie), built
+    from the venues' market indexes and currency names. validate() runs
+    between extraction and execution: deny-listed tokens are dropped, names
+    are resolved to tickers (exact, or a unique prefix of at least min_prefix
+    characters), and unknown ticker-shaped tokens are kept, since a symbol
+    announced before it lists is not in any index yet. Names that do not
+    resolve are returned as unresolved, never guessed; suggest() offers a
+    fuzzy match for the notification only.
+    """
+    def __init__(self, deny=DENY_LIST, min_prefix=4, fuzzy_cutoff=0.85):
+        self.deny = deny
+        self.min_prefix = min_prefix
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.tickers = set()
+        self.names = {}  # normalized name -> ticker
+        self.names_by_initial = {}  # first character -> [normalized name]
+        self.trie = NameTrie()
+        self.last_refreshed = None
+
+    def refresh(self, engines):
+        tickers, names, by_initial, trie = set(), {}, {}, NameTrie()
+        for engine in engines:
+            tickers.update(market.base for market in engine.markets.markets.values() if market.base)
+            for code, currency in (getattr(engine.exchange, "currencies", None) or {}).items():
+                name = normalize_name(currency.get("name") or "")
+                if name and code in tickers and name not in names:
+                    names[name] = code
+                    by_initial.setdefault(name[0], []).append(name)
+                    trie.insert(name, code)
+        self.tickers, self.names, self.names_by_initial, self.trie = tickers, names, by_initial, trie
+        self.last_refreshed = time.time()
+
+    def resolve_name(self, name):
+        """
+        Returns the ticker for an asset name, or None.
+        """
+        key = normalize_name(name)
+        if not key:
+            return None
+        if key in self.names:
+            return self.names[key]
+        if len(key) < self.min_prefix:
+            return None
+        completions = self.trie.complete(key)
+        return next(iter(completions)) if len(completions) == 1 else None
+
+    def suggest(self, name):
+        """
+        Closest known asset name's ticker, or None. Only compares names with
+        the same first character, and is never used to place orders.
+        """
+        key = normalize_name(name)
+        if not key:
+            return None
+        match = difflib.get_close_matches(key, self.names_by_initial.get(key[0], ()), n=1, cutoff=self.fuzzy_cutoff)
+        return self.names[match[0]] if match else None
+
+    def validate(self, symbols):
+        """
+        Returns (tickers to trade, names that did not resolve to a ticker).
+        """
+        valid, unresolved = [], []
+        for symbol in symbols:
+            token = symbol.strip().upper()
+            if token in self.deny:
+                logging.info(f"Dropping {symbol!r}: quote or network token")
+                continue
+            if token in self.tickers:
+                valid.append(token)
+                continue
+            # Ticker-shaped tokens only resolve on an exact name, so an unlisted
+            # ticker is never mapped onto a different listed asset.
+            shaped = TICKER_SHAPE.match(token)
+            resolved = self.names.get(normalize_name(symbol)) if shaped else self.resolve_name(symbol)
+            if resolved is not None:
+                logging.info(f"Resolved {symbol!r} to ticker {resolved}")
+                valid.append(resolved)
+            elif shaped:
+                valid.append(token)  # not listed anywhere yet
+            else:
+                logging.info(f"Not trading {symbol!r}: not a known ticker or asset name")
+                unresolved.append(symbol.strip())
+        return list(dict.fromkeys(valid)), unresolved
+
+    async def run(self, engines, interval=300):
+        """
+        Rebuilds from the (already refreshed) market indexes every interval seconds.
+        """
+        while True:
+            try:
+                self.refresh(engines)
+                logging.info(f"Ticker index: {len(self.tickers)} tickers, {len(self.names)} asset names")
+            except Exception as e:
+                logging.warning(f"Error rebuilding ticker index: {e}")
+            await asyncio.sleep(interval)
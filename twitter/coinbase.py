@@ -1,8 +1,8 @@
-import re
 import sqlite3
 import logging
 from datetime import datetime
 import tweepy
+from symbols.extract import SymbolEngine
 
 logging.basicConfig(
     filename='logs/crypto_bot.log',
@@ -17,33 +17,41 @@ cursor.execute('''CREATE TABLE IF NOT EXISTS listings
                   (ticker TEXT PRIMARY KEY, roadmap_time TEXT, support_time TEXT)''')
 conn.commit()
 
-ticker_pattern = re.compile(r'\(([A-Z]{3,6})\)')
+symbol_engine = SymbolEngine()
+
+def extract_tickers(text):
+    """
+    Extracts every ticker symbol from a tweet with the shared Coinbase grammar.
+    """
+    return symbol_engine.extract("coinbase", text)
 
 def extract_ticker(text):
     """
-    Extracts a ticker symbol from text using a regex.
+    Extracts the first ticker symbol from a tweet, or None.
     """
-    match = ticker_pattern.search(text)
-    return match.group(1) if match else None
+    tickers = extract_tickers(text)
+    return tickers[0] if tickers else None
 
 def check_tweet(tweet, source):
     """
-    Checks a tweet and updates the SQLite database for roadmap or support events.
+    Checks a tweet and updates the SQLite database for roadmap or support events
+    of every ticker it names.
     """
-    ticker = extract_ticker(tweet.text)
-    if not ticker:
+    tickers = extract_tickers(tweet.text)
+    if not tickers:
         return
     current_time = datetime.utcnow().isoformat()
-    if source == "roadmap" and "added to the roadmap" in tweet.text.lower():
-        cursor.execute("INSERT OR IGNORE INTO listings (ticker, roadmap_time) VALUES (?, ?)", (ticker, current_time))
-        logging.info(f"Roadmap addition detected: {ticker} at {current_time}")
-    elif source == "support" and ("trading is now live" in tweet.text.lower() or "support for" in tweet.text.lower()):
-        cursor.execute("UPDATE listings SET support_time = ? WHERE ticker = ? AND support_time IS NULL", (current_time, ticker))
-        if cursor.rowcount > 0:
-            logging.info(f"Support tweet detected: {ticker} at {current_time}")
-        else:
-            cursor.execute("INSERT OR IGNORE INTO listings (ticker, support_time) VALUES (?, ?)", (ticker, current_time))
-            logging.info(f"Support without prior roadmap detected: {ticker} at {current_time}")
+    for ticker in tickers:
+        if source == "roadmap" and "added to the roadmap" in tweet.text.lower():
+            cursor.execute("INSERT OR IGNORE INTO listings (ticker, roadmap_time) VALUES (?, ?)", (ticker, current_time))
+            logging.info(f"Roadmap addition detected: {ticker} at {current_time}")
+        elif source == "support" and ("trading is now live" in tweet.text.lower() or "support for" in tweet.text.lower()):
+            cursor.execute("UPDATE listings SET support_time = ? WHERE ticker = ? AND support_time IS NULL", (current_time, ticker))
+            if cursor.rowcount > 0:
+                logging.info(f"Support tweet detected: {ticker} at {current_time}")
+            else:
+                cursor.execute("INSERT OR IGNORE INTO listings (ticker, support_time) VALUES (?, ?)", (ticker, current_time))
+                logging.info(f"Support without prior roadmap detected: {ticker} at {current_time}")
     conn.commit()
 
 def get_time_difference(ticker):